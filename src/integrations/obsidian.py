@@ -4,11 +4,60 @@ Obsidian Integration
 Reads and updates tasks in Obsidian vault via direct file access.
 """
 
+import os
 import re
+import mmap
+import hashlib
 import logging
+import functools
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from difflib import SequenceMatcher
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from datetime import datetime, date as date_type
+
+
+# Precompiled patterns (avoid re-module cache lookup on every task line)
+_TASK_PREFIX = '- [ ] '
+_TASK_PREFIX_BYTES = _TASK_PREFIX.encode('utf-8')
+_TASK_PREFIX_LEN = len(_TASK_PREFIX)
+_TAG_STRIP_RE = re.compile(r'#[\w/:\-()]+')
+_ENERGY_RE = re.compile(r'#energy/(high|medium|low)')
+_ATTENTION_RE = re.compile(r'#attention/(high|medium|low)')
+_LEVEL_TAG_RES = {'energy': _ENERGY_RE, 'attention': _ATTENTION_RE}
+
+# Daily note structure
+_ACTION_ITEMS_HEADING = 'Action Items'  # #### level (or deeper)
+_FEELING_HEADING = "How I'm Feeling"  # ### level (or deeper)
+_CAPACITY_LABELS = (('Current Energy Level:', 'energy'), ('Focus Capacity:', 'attention'))
+
+# Every tag on a task line in one pass: known tags populate a named group,
+# anything else matches the generic branch so it is still stripped from the title
+_ALL_TAGS_RE = re.compile(
+    r'#(?:'
+    r'(?:(?P<prio>P[1-4])'
+    r'|energy/(?P<energy>high|medium|low)'
+    r'|attention/(?P<att>high|medium|low)'
+    r'|context/(?P<ctx>\w+)'
+    r'|due\((?P<due>[^)]+)\))[\w/:\-()]*'
+    r'|[\w/:\-()]+)'
+)
+
+
+def _title_digest(title: str) -> str:
+    """
+    Short deterministic digest of a task title for use in task IDs
+
+    Built-in hash() is salted per process (PYTHONHASHSEED), which made IDs
+    change between runs; blake2b gives the same ID every time.
+    """
+    return hashlib.blake2b(title.encode('utf-8'), digest_size=4).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_due_date_str(date_str: str) -> datetime:
+    """Parse a due date string (memoized - the same due dates recur across tasks)"""
+    # fromisoformat handles both YYYY-MM-DD and YYYY-MM-DDTHH:mm
+    return datetime.fromisoformat(date_str)
 
 
 class ObsidianIntegration:
@@ -28,6 +77,8 @@ class ObsidianIntegration:
         self.vault_path = Path(config['vault_path']).expanduser()
         self.task_database = self.vault_path / config['task_database']
         self.daily_notes_path = self.vault_path / config['daily_notes_path']
+        self._daily_note_format = config['daily_note_format']
+        self._daily_note_path_for_ordinal = functools.lru_cache(maxsize=64)(self._build_daily_note_path)
 
         # Verify paths exist
         if not self.vault_path.exists():
@@ -35,6 +86,13 @@ class ObsidianIntegration:
         if not self.task_database.exists():
             self.logger.warning(f"Task database not found: {self.task_database}")
 
+        # Parsed results keyed by file stat, so unchanged files are not re-parsed
+        self._db_cache: Optional[List[Dict[str, Any]]] = None
+        self._db_cache_key: Optional[Tuple[int, int]] = None
+        self._daily_cache: Optional[Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]] = None
+        self._daily_cache_key: Optional[Tuple[Path, int, int]] = None
+        self._daily_content: Optional[str] = None
+
     def get_tasks(self) -> List[Dict[str, Any]]:
         """
         Get all tasks from Obsidian task database
@@ -46,12 +104,18 @@ class ObsidianIntegration:
             self.logger.warning(f"Task database not found: {self.task_database}")
             return []
 
-        self.logger.info("Fetching tasks from Obsidian task database...")
-
         try:
+            st = self.task_database.stat()
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if cache_key == self._db_cache_key:
+                self.logger.info("Task database unchanged, using cached parse")
+                return self._copy_tasks(self._db_cache)
+
+            self.logger.info("Fetching tasks from Obsidian task database...")
             tasks = self._parse_task_database()
+            self._db_cache, self._db_cache_key = tasks, cache_key
             self.logger.info(f"Found {len(tasks)} tasks in Obsidian database")
-            return tasks
+            return self._copy_tasks(tasks)
         except Exception as e:
             self.logger.error(f"Error parsing task database: {e}")
             return []
@@ -77,65 +141,187 @@ class ObsidianIntegration:
         self.logger.info(f"Fetching tasks from daily note: {daily_note.name}")
 
         try:
-            content = daily_note.read_text()
-            tasks = self._parse_daily_note_action_items(content)
+            tasks, _ = self._load_daily_note(daily_note)
             self.logger.info(f"Found {len(tasks)} tasks in daily note")
-            return tasks
+            return self._copy_tasks(tasks)
         except Exception as e:
             self.logger.error(f"Error parsing daily note tasks: {e}")
             return []
 
-    def _parse_daily_note_action_items(self, content: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _read_note(path: Path) -> str:
+        """
+        Read a markdown note as UTF-8 text
+
+        Decodes raw bytes directly instead of going through the text-mode
+        layer (locale encoding lookup, universal newline translation);
+        CRLF files are normalized with a single replace.
+        """
+        content = path.read_bytes().decode('utf-8')
+        if '\r\n' in content:
+            content = content.replace('\r\n', '\n')
+        return content
+
+    @staticmethod
+    def _copy_tasks(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Parse action items from daily note Morning Pages Analysis section
+        Copy cached task dicts so callers can mutate them freely
+
+        TaskManager merges source_systems and annotates metadata in place,
+        so the mutable members are copied along with the top-level dict.
+        """
+        return [
+            {**task, 'source_systems': list(task['source_systems']), 'metadata': dict(task['metadata'])}
+            for task in tasks
+        ]
+
+    def _load_daily_note(self, daily_note: Path) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]:
+        """
+        Read and parse a daily note, reusing the last parse if the file is unchanged
+
+        Action items and capacity usually get read back-to-back from the same
+        note, so both come from one file read and one parse. The raw text is
+        kept too, for read_daily_note.
 
         Args:
-            content: Full daily note text
+            daily_note: Path to the daily note
 
         Returns:
-            List of task dictionaries
+            (tasks, capacity) as returned by _parse_daily_note; shared with
+            the cache, so callers must copy before mutating
         """
-        tasks = []
+        st = daily_note.stat()
+        cache_key = (daily_note, st.st_mtime_ns, st.st_size)
+        if cache_key != self._daily_cache_key:
+            content = self._read_note(daily_note)
+            self._daily_cache, self._daily_cache_key = self._parse_daily_note(content), cache_key
+            self._daily_content = content
+        return self._daily_cache
+
+    def read_daily_note(self, daily_note: Path) -> str:
+        """
+        Full text of a daily note, shared with the parse cache
 
-        # Find the "Action Items" section
-        action_items_match = re.search(r'####\s+Action Items\s*\n(.*?)(?=\n####|\n###|\Z)', content, re.DOTALL)
-        if not action_items_match:
-            return tasks
+        A sync reads the note's tasks and capacity and then its raw text;
+        while the file is unchanged that is a single read.
 
-        action_items_section = action_items_match.group(1)
-        lines = action_items_section.split('\n')
+        Args:
+            daily_note: Path to the daily note
 
-        for i, line in enumerate(lines):
-            # Match uncompleted tasks
-            task_match = re.match(r'^- \[ \] (.+)$', line)
-            if not task_match:
-                continue
+        Returns:
+            Note contents
+        """
+        self._load_daily_note(daily_note)
+        return self._daily_content
 
-            task_text = task_match.group(1).strip()
+    def _parse_daily_note(self, content: str) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]:
+        """
+        Parse action items and capacity from a daily note in a single line pass
 
-            # Remove all tags to get clean title
-            title = re.sub(r'#[\w/:\-()]+', '', task_text).strip()
+        Sections (first occurrence of each wins):
+            #### Action Items   - runs until the next ###-or-deeper heading
+            ### How I'm Feeling - runs until the next ##-or-deeper heading
 
-            # Generate unique ID
-            task_id = f"daily_{hash(title) % 1000000:06d}"
+        Within "How I'm Feeling", looks for lines like:
+            - Current Energy Level: #energy/high
+            - Focus Capacity: #attention/medium
 
-            task = {
-                'id': task_id,
-                'title': title,
-                'priority': 'P2',  # Default priority for daily note tasks
-                'energy': 'medium',
-                'attention': 'medium',
-                'due_date': None,
-                'source_systems': ['daily_note'],
-                'metadata': {
-                    'raw_line': task_text,
-                    'source': 'action_items'
-                }
-            }
+        Both labels may share one line. Only the first value of each kind
+        counts, and template values with "or" (e.g. #energy/high or
+        #energy/medium or #energy/low) are ignored.
 
-            tasks.append(task)
+        Args:
+            content: Full daily note text
 
-        return tasks
+        Returns:
+            (tasks, capacity) - task dictionaries from Action Items, and a dict
+            with 'energy'/'attention' keys, or None if there is no
+            "How I'm Feeling" section
+        """
+        tasks = []
+        capacity = None
+        capacity_seen = set()
+
+        in_action = in_feeling = False
+        action_done = False
+
+        for line in content.split('\n'):
+            if line.startswith('##'):
+                # Section boundaries
+                if in_action and line.startswith('###'):
+                    in_action, action_done = False, True
+                if in_feeling:
+                    in_feeling = False
+
+                # Section starts: '#'*level, whitespace, heading text
+                heading = line.lstrip('#')
+                level = len(line) - len(heading)
+                if heading[:1].isspace():
+                    heading = heading.strip()
+                    if level >= 4 and heading == _ACTION_ITEMS_HEADING and not (in_action or action_done):
+                        in_action = True
+                    elif level >= 3 and heading == _FEELING_HEADING and capacity is None:
+                        in_feeling = True
+                        capacity = {"energy": "medium", "attention": "medium"}
+                continue
+
+            if in_action:
+                # Match uncompleted tasks
+                if line.startswith(_TASK_PREFIX):
+                    task_text = line[_TASK_PREFIX_LEN:].strip()
+                    if task_text:
+                        tasks.append(self._build_daily_note_task(task_text))
+
+            elif in_feeling and len(capacity_seen) < 2:
+                # A line may hold both labels; each value runs up to the next label
+                found = sorted(
+                    (idx, label, kind)
+                    for label, kind in _CAPACITY_LABELS
+                    for idx in (line.find(label),)
+                    if idx != -1
+                )
+                for pos, (idx, label, kind) in enumerate(found):
+                    end = found[pos + 1][0] if pos + 1 < len(found) else len(line)
+                    value = line[idx + len(label):end]
+                    if value and kind not in capacity_seen:
+                        capacity_seen.add(kind)
+                        # If it contains "or", it's a template
+                        if ' or ' not in value:
+                            level_match = _LEVEL_TAG_RES[kind].search(value)
+                            if level_match:
+                                capacity[kind] = level_match.group(1)
+
+        return tasks, capacity
+
+    def _build_daily_note_task(self, task_text: str) -> Dict[str, Any]:
+        """
+        Build a task dictionary from a daily note action item
+
+        Args:
+            task_text: Action item text (checkbox removed)
+
+        Returns:
+            Task dictionary
+        """
+        # Remove all tags to get clean title
+        title = _TAG_STRIP_RE.sub('', task_text).strip()
+
+        # Generate unique ID (stable across runs)
+        task_id = f"daily_{_title_digest(title)}"
+
+        return {
+            'id': task_id,
+            'title': title,
+            'priority': 'P2',  # Default priority for daily note tasks
+            'energy': 'medium',
+            'attention': 'medium',
+            'due_date': None,
+            'source_systems': ['daily_note'],
+            'metadata': {
+                'raw_line': task_text,
+                'source': 'action_items'
+            }
+        }
 
     def get_current_capacity(self, date: Optional[datetime] = None) -> Dict[str, str]:
         """
@@ -158,12 +344,22 @@ class ObsidianIntegration:
         self.logger.info(f"Reading capacity from: {daily_note.name}")
 
         try:
-            content = daily_note.read_text()
-            return self._parse_capacity(content)
+            _, capacity = self._load_daily_note(daily_note)
         except Exception as e:
             self.logger.error(f"Error parsing capacity: {e}")
             return {"energy": "medium", "attention": "medium"}
 
+        if capacity is None:
+            self.logger.info("No 'How I'm Feeling' section found, using defaults")
+            return {"energy": "medium", "attention": "medium"}
+
+        if capacity['energy'] == 'medium' and capacity['attention'] == 'medium':
+            self.logger.info("Template detected (not filled in), using default capacity: medium/medium")
+        else:
+            self.logger.info(f"Parsed capacity: energy={capacity['energy']}, attention={capacity['attention']}")
+
+        return dict(capacity)
+
     def mark_complete(self, task_text: str) -> bool:
         """
         Mark task as complete in Obsidian task database
@@ -177,75 +373,108 @@ class ObsidianIntegration:
         Returns:
             True if successful, False otherwise
         """
-        from difflib import SequenceMatcher
+        return self.mark_complete_many({task_text: task_text})[task_text]
+
+    def mark_complete_many(self, task_texts: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Mark several tasks complete with one read and one write of the task database
+
+        Each title is fuzzy-matched like mark_complete, and each entry checks
+        off at most one line: a line completed for one entry is not matched
+        again, so two entries with the same title need two matching lines.
+
+        Args:
+            task_texts: Dict mapping a caller key (e.g. task ID) to the title
+                of the task to mark complete (no tags)
+
+        Returns:
+            Dict mapping each key to whether its task was marked complete
+        """
+        results = {key: False for key in task_texts}
 
         if not self.task_database.exists():
             self.logger.error(f"Task database not found: {self.task_database}")
-            return False
-
-        self.logger.info(f"Marking Obsidian task complete: {task_text[:50]}...")
+            return results
 
         try:
             # Read current content
             content = self.task_database.read_text()
             lines = content.split('\n')
 
-            # Find matching task line
-            best_match_idx = None
-            best_similarity = 0.0
-            threshold = 0.85  # 85% similarity required
-
+            # Uncompleted task lines, with checkbox and tags removed (once per batch)
+            open_tasks = {}
             for i, line in enumerate(lines):
-                # Only look at uncompleted tasks
                 if not line.strip().startswith('- [ ]'):
                     continue
-
-                # Extract task text (remove checkbox and tags)
                 task_line = line.replace('- [ ]', '').strip()
-                # Remove all tags
-                task_line_clean = re.sub(r'#[\w/:\-()]+', '', task_line).strip()
-
-                # Compare to input
-                similarity = SequenceMatcher(
-                    None,
-                    task_text.lower().strip(),
-                    task_line_clean.lower().strip()
-                ).ratio()
-
-                if similarity > best_similarity and similarity >= threshold:
-                    best_similarity = similarity
-                    best_match_idx = i
-
-            if best_match_idx is None:
-                self.logger.warning(
-                    f"No matching task found for: {task_text[:50]}...\n"
-                    f"(searched with {threshold*100}% similarity threshold)"
-                )
-                return False
+                open_tasks[i] = _TAG_STRIP_RE.sub('', task_line).strip().lower()
 
-            # Mark task complete
-            original_line = lines[best_match_idx]
-            completed_line = original_line.replace('- [ ]', '- [x]', 1)
-            lines[best_match_idx] = completed_line
+            threshold = 0.85  # 85% similarity required
+            changed = False
+
+            for key, task_text in task_texts.items():
+                self.logger.info(f"Marking Obsidian task complete: {task_text[:50]}...")
+                # One matcher per title: seq2 is the target, so its analysis is
+                # reused across candidates. autojunk is off - it treats chars
+                # that repeat a lot in longer titles as junk and skews ratio()
+                matcher = SequenceMatcher(autojunk=False)
+                matcher.set_seq2(task_text.lower().strip())
+
+                # Find matching task line
+                best_match_idx = None
+                best_similarity = 0.0
+
+                for i, task_line_clean in open_tasks.items():
+                    matcher.set_seq1(task_line_clean)
+                    # real_quick_ratio/quick_ratio are cheap upper bounds on
+                    # ratio(): skip lines that can't pass or beat the best
+                    floor = max(threshold, best_similarity)
+                    if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                        continue
+                    similarity = matcher.ratio()
+
+                    if similarity > best_similarity and similarity >= threshold:
+                        best_similarity = similarity
+                        best_match_idx = i
+
+                if best_match_idx is None:
+                    self.logger.warning(
+                        f"No matching task found for: {task_text[:50]}...\n"
+                        f"(searched with {threshold*100}% similarity threshold)"
+                    )
+                    continue
 
-            # Write back to file
-            new_content = '\n'.join(lines)
-            self.task_database.write_text(new_content)
+                # Mark task complete
+                original_line = lines[best_match_idx]
+                lines[best_match_idx] = original_line.replace('- [ ]', '- [x]', 1)
+                del open_tasks[best_match_idx]
+                results[key] = changed = True
 
-            self.logger.info(
-                f"✅ Marked complete in Obsidian (similarity: {best_similarity:.2f})\n"
-                f"   Changed: {original_line.strip()[:70]}..."
-            )
+                self.logger.info(
+                    f"✅ Marked complete in Obsidian (similarity: {best_similarity:.2f})\n"
+                    f"   Changed: {original_line.strip()[:70]}..."
+                )
 
-            return True
+            if changed:
+                # Write back to file
+                self.task_database.write_text('\n'.join(lines))
+                self._db_cache = self._db_cache_key = None
+
+            return results
 
         except Exception as e:
             self.logger.error(f"Failed to mark task complete: {e}")
-            return False
+            return {key: False for key in task_texts}
 
     def _get_daily_note_path(self, date: datetime) -> Path:
         """Get path to daily note for specified date"""
-        date_str = date.strftime(self.config['daily_note_format'])
+        # Keyed on the ordinal day: daily notes are per-date, and tz-aware
+        # datetimes don't make reliable cache keys
+        return self._daily_note_path_for_ordinal(date.toordinal())
+
+    def _build_daily_note_path(self, ordinal: int) -> Path:
+        """Format the daily note path for a proleptic Gregorian ordinal day"""
+        date_str = date_type.fromordinal(ordinal).strftime(self._daily_note_format)
         return self.daily_notes_path / f"{date_str}.md"
 
     def _parse_task_database(self) -> List[Dict[str, Any]]:
@@ -256,31 +485,33 @@ class ObsidianIntegration:
             List of parsed tasks with normalized structure
         """
         tasks = []
-        content = self.task_database.read_text()
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines):
-            # Match uncompleted tasks: - [ ] Task text
-            task_match = re.match(r'^- \[ \] (.+)$', line)
-            if not task_match:
-                continue
-
-            task_text = task_match.group(1)
-
-            # Extract tags using regex
-            priority = self._extract_tag(task_text, r'#(P[1-4])', default='P3')
-            energy = self._extract_tag(task_text, r'#energy/(high|medium|low)', default='medium')
-            attention = self._extract_tag(task_text, r'#attention/(high|medium|low)', default='medium')
-            context = self._extract_tag(task_text, r'#context/(\w+)', default='personal')
 
-            # Extract due date
-            due_date = self._extract_due_date(task_text)
-
-            # Remove all tags to get clean title
-            title = re.sub(r'#[\w/:\-()]+', '', task_text).strip()
-
-            # Generate unique ID (hash of title)
-            task_id = f"obs_{hash(title) % 1000000:06d}"
+        for line_number, task_text in self._iter_task_database_lines():
+            # Extract tags and strip them from the title in a single scan
+            # (first occurrence of each known tag wins)
+            tags = {}
+            title_parts = []
+            pos = 0
+            for tag_match in _ALL_TAGS_RE.finditer(task_text):
+                start, end = tag_match.span()
+                title_parts.append(task_text[pos:start])
+                pos = end
+                kind = tag_match.lastgroup
+                if kind is not None and kind not in tags:
+                    tags[kind] = tag_match.group(kind)
+            title_parts.append(task_text[pos:])
+
+            priority = tags.get('prio', 'P3')
+            energy = tags.get('energy', 'medium')
+            attention = tags.get('att', 'medium')
+            context = tags.get('ctx', 'personal')
+            due_date = self._parse_due_date(tags['due']) if 'due' in tags else None
+
+            # Clean title is everything outside the tags
+            title = ''.join(title_parts).strip()
+
+            # Generate unique ID (hash of title, stable across runs)
+            task_id = f"obs_{_title_digest(title)}"
 
             task = {
                 'id': task_id,
@@ -293,7 +524,7 @@ class ObsidianIntegration:
                 'source_systems': ['obsidian'],
                 'metadata': {
                     'raw_line': task_text,
-                    'line_number': i + 1
+                    'line_number': line_number
                 }
             }
 
@@ -301,77 +532,31 @@ class ObsidianIntegration:
 
         return tasks
 
-    def _extract_tag(self, text: str, pattern: str, default: str = None) -> Optional[str]:
-        """Extract a tag value using regex pattern"""
-        match = re.search(pattern, text)
-        return match.group(1) if match else default
-
-    def _extract_due_date(self, text: str) -> Optional[datetime]:
-        """Extract due date from #due(YYYY-MM-DD) or #due(YYYY-MM-DDTHH:mm) format"""
-        due_match = re.search(r'#due\(([^\)]+)\)', text)
-        if not due_match:
-            return None
+    def _iter_task_database_lines(self) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (line_number, task_text) for each uncompleted task in the database
 
-        date_str = due_match.group(1)
+        The file is memory-mapped and scanned as bytes; only task lines are
+        decoded, so prose and headers never become Python strings.
+        """
+        with open(self.task_database, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap cannot map an empty file
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for i, line in enumerate(iter(mm.readline, b'')):
+                    # Match uncompleted tasks: - [ ] Task text
+                    if not line.startswith(_TASK_PREFIX_BYTES):
+                        continue
+
+                    task_text = line[_TASK_PREFIX_LEN:].rstrip(b'\r\n').decode('utf-8')
+                    if task_text:
+                        yield i + 1, task_text
+
+    def _parse_due_date(self, date_str: str) -> Optional[datetime]:
+        """Parse the value of a #due(YYYY-MM-DD) or #due(YYYY-MM-DDTHH:mm) tag"""
         try:
-            # Try datetime format first
-            if 'T' in date_str:
-                return datetime.strptime(date_str, '%Y-%m-%dT%H:%M')
-            else:
-                return datetime.strptime(date_str, '%Y-%m-%d')
+            return _parse_due_date_str(date_str)
         except ValueError:
             self.logger.warning(f"Failed to parse due date: {date_str}")
             return None
-
-    def _parse_capacity(self, content: str) -> Dict[str, str]:
-        """
-        Parse energy/attention from daily note content
-
-        Args:
-            content: Full text of daily note
-
-        Returns:
-            Dict with energy and attention levels
-
-        Looks for patterns like:
-            - Current Energy Level: #energy/high
-            - Focus Capacity: #attention/medium
-
-        Ignores template lines with "or" (e.g. #energy/high or #energy/medium or #energy/low)
-        """
-        capacity = {"energy": "medium", "attention": "medium"}
-
-        # Find "How I'm Feeling" section
-        feeling_section = re.search(r'###\s+How I\'m Feeling\s*\n(.*?)(?=\n###|\n##|\Z)', content, re.DOTALL)
-        if not feeling_section:
-            self.logger.info("No 'How I'm Feeling' section found, using defaults")
-            return capacity
-
-        section_text = feeling_section.group(1)
-
-        # Extract energy level (only if not template with "or")
-        energy_line_match = re.search(r'Current Energy Level:(.+?)$', section_text, re.MULTILINE)
-        if energy_line_match:
-            energy_line = energy_line_match.group(1)
-            # If it contains "or", it's a template
-            if ' or ' not in energy_line:
-                energy_match = re.search(r'#energy/(high|medium|low)', energy_line)
-                if energy_match:
-                    capacity['energy'] = energy_match.group(1)
-
-        # Extract attention level (only if not template with "or")
-        attention_line_match = re.search(r'Focus Capacity:(.+?)$', section_text, re.MULTILINE)
-        if attention_line_match:
-            attention_line = attention_line_match.group(1)
-            # If it contains "or", it's a template
-            if ' or ' not in attention_line:
-                attention_match = re.search(r'#attention/(high|medium|low)', attention_line)
-                if attention_match:
-                    capacity['attention'] = attention_match.group(1)
-
-        if capacity['energy'] == 'medium' and capacity['attention'] == 'medium':
-            self.logger.info("Template detected (not filled in), using default capacity: medium/medium")
-        else:
-            self.logger.info(f"Parsed capacity: energy={capacity['energy']}, attention={capacity['attention']}")
-
-        return capacity
@@ -10,13 +10,69 @@ Architecture:
 """
 
 import os
+import sys
 import json
+import functools
 import logging
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as a fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: only used to stream large caches
+    ijson = None
+
+
+# Caches above this size are stream-parsed (when ijson is available);
+# below it a plain json.load is faster than ijson's per-event overhead
+STREAM_PARSE_THRESHOLD_BYTES = 256_000
+
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Label → (category, level) lookup for _extract_levels_from_labels; labels
+# that merely contain a level (e.g. 'my-energy-low') fall back to the regex
+_LEVEL_LABELS = {
+    f'{category}-{level}': (category, level)
+    for category in ('energy', 'attention')
+    for level in ('low', 'medium', 'high')
+}
+_LEVEL_LABEL_RE = re.compile(r'(energy|attention)-(low|medium|high)')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse a Todoist ISO-8601 datetime (memoized - due dates repeat across tasks)
+
+    Python 3.11+ fromisoformat() accepts a trailing 'Z' directly.
+    """
+    if not _FROMISOFORMAT_ACCEPTS_Z:
+        value = value.replace('Z', '+00:00')
+    return datetime.fromisoformat(value)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes (orjson when installed; its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """Encode obj as one compact line of JSON (JSONL record)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
 
 class TodoistIntegration:
     """Integration with Todoist task management system via MCP"""
@@ -32,17 +88,55 @@ class TodoistIntegration:
         self.logger = logging.getLogger("TaskManager.Todoist")
         self.enabled = config.get('enabled', True)
 
-        # Cache file path (synced by Claude Code via MCP)
-        project_root = Path(__file__).parent.parent.parent
-        self.cache_dir = project_root / 'cache'
+        # Cache file path (synced by Claude Code via MCP); defaults to cache/
+        # in the project root
+        cache_dir = config.get('cache_dir')
+        if cache_dir:
+            self.cache_dir = Path(cache_dir).expanduser()
+        else:
+            self.cache_dir = Path(__file__).parent.parent.parent / 'cache'
         self.cache_file = self.cache_dir / 'todoist_tasks.json'
+        self.completions_file = self.cache_dir / 'todoist_completions.jsonl'
 
         # Create cache directory if it doesn't exist
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._migrate_legacy_completions()
 
         if not self.enabled:
             self.logger.warning("Todoist integration disabled in config")
 
+    def _migrate_legacy_completions(self) -> None:
+        """
+        Move pending requests from the old todoist_completions.json into the JSONL log
+
+        Older versions kept the queue as a single JSON array. Its entries are
+        appended to todoist_completions.jsonl and the old file is removed, so
+        requests queued before the upgrade are not lost.
+        """
+        legacy_file = self.cache_dir / 'todoist_completions.json'
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, 'rb') as f:
+                completions = _json_loads(f.read())
+            if not isinstance(completions, list):
+                raise ValueError("expected a JSON array of completion requests")
+            payload = b''.join(_json_dumps_line(request) for request in completions)
+            with open(self.completions_file, 'ab') as f:
+                f.write(payload)
+            legacy_file.unlink()
+            self.logger.info(
+                f"Migrated {len(completions)} completion request(s) from {legacy_file.name} "
+                f"to {self.completions_file.name}"
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Could not migrate {legacy_file} to {self.completions_file.name}: {e}\n"
+                "Requests in the old file are not processed until it is migrated"
+            )
+
     def get_tasks(self) -> List[Dict[str, Any]]:
         """
         Get all tasks from Todoist cache
@@ -70,16 +164,23 @@ class TodoistIntegration:
             return []
 
         try:
+            if ijson is not None and self.cache_file.stat().st_size > STREAM_PARSE_THRESHOLD_BYTES:
+                # Stream items straight into the parser so completed tasks
+                # are skipped without ever materialising the full list
+                self.logger.info("Stream-parsing large Todoist cache...")
+                with open(self.cache_file, 'rb') as f:
+                    return self._parse_todoist_tasks(ijson.items(f, 'item'))
+
             # Read cache file
-            with open(self.cache_file, 'r') as f:
-                raw_tasks = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                raw_tasks = _json_loads(f.read())
 
             self.logger.info(f"Loaded {len(raw_tasks)} tasks from cache")
 
             # Parse into normalized format
             return self._parse_todoist_tasks(raw_tasks)
 
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             self.logger.error(f"Failed to parse Todoist cache: {e}")
             return []
         except Exception as e:
@@ -90,8 +191,9 @@ class TodoistIntegration:
         """
         Mark task as complete in Todoist
 
-        Note: This method writes a completion request to cache/todoist_completions.json.
-        Claude Code should monitor this file and execute completions via MCP.
+        Note: This method appends a completion request to cache/todoist_completions.jsonl
+        (one JSON object per line). Claude Code should monitor this file and
+        execute completions via MCP.
 
         Architecture:
         1. Python writes completion request to cache file
@@ -105,47 +207,54 @@ class TodoistIntegration:
         Returns:
             True if request written successfully, False otherwise
         """
-        if not self.enabled:
-            return False
+        return self.mark_complete_many([task_id]).get(task_id, False)
 
-        # Remove 'todoist_' prefix if present
-        if task_id.startswith('todoist_'):
-            task_id = task_id.replace('todoist_', '')
+    def mark_complete_many(self, task_ids: List[str]) -> Dict[str, bool]:
+        """
+        Queue completion requests for several Todoist tasks in one append
 
-        self.logger.info(f"Marking Todoist task {task_id} complete...")
+        Args:
+            task_ids: Todoist task IDs (with or without 'todoist_' prefix)
 
-        try:
-            # Load existing completion requests
-            completions_file = self.cache_dir / 'todoist_completions.json'
-            completions = []
+        Returns:
+            Dict mapping each given task ID to whether its request was queued
+        """
+        if not self.enabled:
+            return {task_id: False for task_id in task_ids}
 
-            if completions_file.exists():
-                with open(completions_file, 'r') as f:
-                    completions = json.load(f)
+        # Remove 'todoist_' prefix if present
+        bare_ids = [task_id[len('todoist_'):] if task_id.startswith('todoist_') else task_id
+                    for task_id in task_ids]
 
-            # Add new completion request
-            completions.append({
-                'task_id': task_id,
-                'requested_at': datetime.now().isoformat(),
-                'status': 'pending'
-            })
+        self.logger.info(f"Marking Todoist task(s) {', '.join(bare_ids)} complete...")
 
-            # Write back to file
-            with open(completions_file, 'w') as f:
-                json.dump(completions, f, indent=2)
+        try:
+            # Append all requests in one write, one line each; the log is
+            # never rewritten
+            requested_at = datetime.now().isoformat()
+            payload = b''.join(
+                _json_dumps_line({
+                    'task_id': task_id,
+                    'requested_at': requested_at,
+                    'status': 'pending'
+                })
+                for task_id in bare_ids
+            )
+            with open(self.completions_file, 'ab') as f:
+                f.write(payload)
 
             self.logger.info(
-                f"✅ Completion request queued for task {task_id}\n"
+                f"✅ Completion request(s) queued for {len(bare_ids)} task(s)\n"
                 f"Run `task-manager sync` or ask Claude Code to process completions"
             )
 
-            return True
+            return {task_id: True for task_id in task_ids}
 
         except Exception as e:
             self.logger.error(f"Failed to queue completion: {e}")
-            return False
+            return {task_id: False for task_id in task_ids}
 
-    def _parse_todoist_tasks(self, raw_tasks: List[Dict]) -> List[Dict[str, Any]]:
+    def _parse_todoist_tasks(self, raw_tasks: Iterable[Dict]) -> List[Dict[str, Any]]:
         """
         Parse Todoist tasks into standard format
 
@@ -156,7 +265,7 @@ class TodoistIntegration:
         - Todoist priority 1 (normal) → P4
 
         Args:
-            raw_tasks: Raw task data from Todoist API/MCP
+            raw_tasks: Raw task data from Todoist API/MCP (list or streaming iterator)
 
         Returns:
             List of normalized task dictionaries
@@ -192,8 +301,8 @@ class TodoistIntegration:
                 # Try datetime first, then date
                 if due_info.get('datetime'):
                     try:
-                        due_date = datetime.fromisoformat(due_info['datetime'].replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
+                        due_date = _parse_iso_datetime(due_info['datetime'])
+                    except (ValueError, TypeError, AttributeError):
                         pass
                 elif due_info.get('date'):
                     try:
@@ -204,8 +313,7 @@ class TodoistIntegration:
             # Extract energy/attention from labels
             # Look for labels like 'energy-low', 'attention-high', etc.
             labels = task.get('labels', [])
-            energy = self._extract_level_from_labels(labels, 'energy')
-            attention = self._extract_level_from_labels(labels, 'attention')
+            energy, attention = self._extract_levels_from_labels(labels)
 
             # Generate task dict
             parsed_task = {
@@ -230,27 +338,33 @@ class TodoistIntegration:
         self.logger.info(f"Parsed {len(parsed_tasks)} Todoist tasks")
         return parsed_tasks
 
-    def _extract_level_from_labels(self, labels: List[str], category: str) -> str:
+    def _extract_levels_from_labels(self, labels: List[str]) -> Tuple[str, str]:
         """
-        Extract energy/attention level from Todoist labels
+        Extract energy and attention levels from Todoist labels in one pass
 
         Looks for labels like:
         - 'energy-low', 'energy-medium', 'energy-high'
         - 'attention-low', 'attention-medium', 'attention-high'
 
+        A label matches if it contains one of these anywhere (so 'my-energy-low'
+        sets energy). Each label is lowercased once and exact labels skip the
+        regex; the first match per category wins.
+
         Args:
             labels: List of label strings
-            category: 'energy' or 'attention'
 
         Returns:
-            'low', 'medium', or 'high' (defaults to 'medium')
+            (energy, attention), each 'low', 'medium', or 'high' (defaults to 'medium')
         """
-        pattern = f'{category}-(low|medium|high)'
+        found = {}
 
         for label in labels:
-            match = re.search(pattern, label.lower())
-            if match:
-                return match.group(1)
+            label = label.lower()
+            hit = _LEVEL_LABELS.get(label)
+            for category, level in (hit,) if hit else _LEVEL_LABEL_RE.findall(label):
+                found.setdefault(category, level)
+            if len(found) == 2:
+                break
 
         # Default to medium
-        return 'medium'
+        return found.get('energy', 'medium'), found.get('attention', 'medium')
@@ -12,16 +12,61 @@ AI-powered task orchestrator that:
 """
 
 import os
+import re
 import sys
-import yaml
+import string
+import time
+import heapq
 import logging
+import importlib.util
+import urllib.parse
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass
-
-
-@dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date, datetime
+from collections import Counter
+from operator import attrgetter, itemgetter
+from dataclasses import dataclass, field, replace
+from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: numpy is only used for batched similarity matrices, and is
+# imported on first use there since it dominates module import time
+_HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:  # optional: difflib is used as a fallback
+    fuzz = fuzz_process = None
+
+
+PRIORITIES = ('P1', 'P2', 'P3', 'P4')
+LEVELS = ('high', 'medium', 'low')  # energy / attention
+LEVEL_RANK = {'low': 0, 'medium': 1, 'high': 2}
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITIES)}  # P1 first
+PRIORITY_LABELS = {
+    'P1': '🔴 P1 Tasks (Urgent)',
+    'P2': '🟡 P2 Tasks (High)',
+    'P3': '🟢 P3 Tasks (Normal)',
+    'P4': '🔵 P4 Tasks (Low)'
+}
+
+# Sort key for lowest-Attention-Tax-first selection
+_by_attention_tax = attrgetter('attention_tax')
+
+# Daily note ## Tasks section: from its heading to the next non-Tasks ## heading (or the end)
+_TASKS_SECTION_RE = re.compile(r'## Tasks\n.*?(?=\n## [^T]|\Z)', re.DOTALL)
+# Insert point for a new ## Tasks section: end of ## Planning, right before ## Notes.
+# Lookahead only: the Notes heading position is needed, not its text
+_PLANNING_SECTION_RE = re.compile(r'## Planning.*?(?=\n## Notes)', re.DOTALL)
+# Task lines in the ## Tasks section: - [x] **Task Title** ... / - [ ] **Task Title** ...
+_CHECKED_TASK_RE = re.compile(r'^- \[x\] \*\*(.+?)\*\*', re.MULTILINE)
+_UNCHECKED_TASK_RE = re.compile(r'^- \[ \] \*\*(.+?)\*\*', re.MULTILINE)
+
+# Titles at least this similar (0-100) are treated as the same task
+FUZZY_MATCH_THRESHOLD = 80
+
+
+@dataclass(slots=True)
 class Task:
     """Unified task representation across all systems"""
     id: str
@@ -32,23 +77,117 @@ class Task:
     due_date: Optional[datetime]
     source_systems: List[str]  # ['todoist', 'obsidian', 'daily_note']
     attention_tax: float = 0.0
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> 'Task':
+        """Build a Task from an integration's task dict (extra keys like 'context' are ignored)"""
+        return cls(
+            id=raw['id'],
+            title=raw['title'],
+            priority=raw['priority'],
+            energy=raw['energy'],
+            attention=raw['attention'],
+            due_date=raw['due_date'],
+            source_systems=raw['source_systems'],
+            metadata=raw['metadata']
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Capacity:
     """User's current energy and attention capacity"""
     energy: str  # high, medium, low
     attention: str  # high, medium, low
-    timestamp: datetime = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+def _local_wall_clock(due_date: datetime) -> datetime:
+    """
+    due_date as a naive local datetime
+
+    Todoist due datetimes are timezone-aware ('...Z') while Obsidian ones are
+    naive local times. Aware values are converted to the local timezone
+    first, so a task due 01:00 UTC counts toward the previous day for a user
+    west of UTC, as it does on their calendar.
+    """
+    if due_date.tzinfo is None:
+        return due_date
+    return due_date.astimezone().replace(tzinfo=None)
+
+
+def _days_until(due_date: datetime, today: date) -> int:
+    """
+    Calendar days from today until due_date (negative once overdue)
+
+    Compared by local date, not timestamp: a task due today is 0 days away
+    all day, rather than -1 as soon as its (often midnight) due time passes.
+    """
+    # Ordinal difference: plain int arithmetic, no intermediate date/timedelta
+    return _local_wall_clock(due_date).toordinal() - today.toordinal()
+
+
+def _due_sort_key(due_date: Optional[datetime]) -> datetime:
+    """
+    Sort key for due dates, soonest first and undated tasks last
+
+    Aware and naive due dates can't be compared directly, so both are
+    compared as naive local times (see _local_wall_clock).
+    """
+    if due_date is None:
+        return datetime.max
+    return _local_wall_clock(due_date)
+
+
+def _format_due(due_date: datetime) -> str:
+    """Due date as YYYY-MM-DD on the local calendar"""
+    return _local_wall_clock(due_date).strftime('%Y-%m-%d')
+
+
+# Dashboard header line stamped with the generation time
+_DASHBOARD_UPDATED_PREFIX = "*Last updated: "
+
+
+def _without_updated_stamp(content: str) -> str:
+    """Dashboard content minus its "Last updated" line, for change detection"""
+    return '\n'.join(
+        line for line in content.split('\n') if not line.startswith(_DASHBOARD_UPDATED_PREFIX)
+    )
+
+
+def _normalize_title(title: str) -> str:
+    """Case-insensitive form of a title used for matching (casefold handles more than lower)"""
+    return title.casefold().strip()
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+
+# ASCII punctuation treated as a word break by the dedup key ("Fix bug!" ==
+# "fix bug"). '#' and '+' are kept: they carry meaning ("C#" vs "C++")
+_DEDUP_PUNCTUATION = str.maketrans({c: ' ' for c in string.punctuation if c not in '#+'})
+
+
+def _dedup_key(title: str) -> str:
+    """
+    Form of a title compared by deduplicate_tasks
+
+    Like _normalize_title, but punctuation becomes a space and whitespace
+    runs collapse. Punctuation is not deleted outright, which would make
+    "re-sign lease" and "resign lease" collide.
+    """
+    return ' '.join(title.translate(_DEDUP_PUNCTUATION).casefold().split())
+
+
+def _bigrams(text: str) -> set:
+    """Set of 2-character substrings of text (empty if shorter than 2)"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+# Titles up to this long bypass the dedup bigram index and are compared
+# against every candidate. Two titles at least 80% similar with a combined
+# length of 10+ always share a bigram: with M matched characters of T total,
+# ratio >= 0.8 means M >= 0.4T, and an alignment keeps at least 3M - T - 1
+# of the first title's bigrams intact, which is >= 1 once T >= 10. A pair
+# shorter than that has both titles at or under this length.
+_BLOCKING_SHORT_TITLE_LEN = 8
 
 
 class TaskManager:
@@ -63,6 +202,23 @@ class TaskManager:
         self.logger = self._setup_logging()
         self.project_root = self._detect_project_root()
         self.config = self._load_config(config_path)
+        self._tax_table = self._build_attention_tax_table()
+
+        # Critical-task rules, snapshotted once instead of re-read per task
+        critical_config = self.config.get('critical_tasks') or {}
+        self._critical_due_days = critical_config.get('due_within_days', 2)
+        self._critical_p1_with_deadline = critical_config.get('p1_with_deadline_critical', True)
+        self._critical_tag_re = self._compile_any_of(
+            f'#{tag}' for tag in critical_config.get('critical_tags') or ()
+        )
+        self._urgent_keyword_re = self._compile_any_of(
+            _normalize_title(keyword) for keyword in critical_config.get('urgent_keywords') or ()
+        )
+
+        # Short-lived aggregate_tasks cache: (monotonic timestamp, tasks, tasks by id),
+        # plus the deduplicated view of that same fetch once it's been computed
+        self._task_cache: Optional[Tuple[float, List[Task], Dict[str, Task]]] = None
+        self._unique_task_cache: Optional[Tuple[float, List[Task]]] = None
 
         # Initialize integrations
         from integrations import ObsidianIntegration, TodoistIntegration
@@ -116,8 +272,17 @@ class TaskManager:
                 )
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
+        # Imported here so paths that never build a TaskManager (e.g. --help)
+        # don't pay for PyYAML
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as Loader
+
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            # libyaml's C loader when available, same safe tag set as safe_load
+            return yaml.load(f, Loader=Loader)
 
     def is_ready(self) -> bool:
         """Check if agent is ready to operate"""
@@ -126,90 +291,201 @@ class TaskManager:
 
     # ==================== Core Methods ====================
 
-    def aggregate_tasks(self) -> List[Task]:
+    def aggregate_tasks(self, deduplicate: bool = False, force_refresh: bool = False) -> List[Task]:
         """
         Aggregate tasks from all sources
 
+        Results are cached for `cache_ttl` seconds (config, default 60) so
+        repeated calls within one run don't re-read every integration. Each
+        call returns fresh Task copies, since callers mutate them.
+
+        Args:
+            deduplicate: Return the deduplicated tasks instead. The dedup pass
+                runs once per fetch and is cached alongside the raw tasks.
+            force_refresh: Ignore the cache and re-read every source
+
         Returns:
             List of Task objects from all systems
         """
+        if force_refresh:
+            self._task_cache = None
+
+        if deduplicate:
+            return self._copy_tasks(self._get_unique_tasks())
+
+        cached = self._get_cached_tasks()
+        if cached is not None:
+            self.logger.info(f"Using {len(cached[0])} cached tasks")
+            return self._copy_tasks(cached[0])
+
         self.logger.info("Aggregating tasks from all sources...")
-        tasks = []
 
-        # Get tasks from Obsidian
-        tasks.extend(self._get_obsidian_tasks())
+        # Sources are independent I/O (vault files, Todoist API), so fetch them
+        # concurrently; results are still combined in a fixed order
+        fetchers = [self._get_obsidian_tasks]
 
         # Get tasks from Todoist (if enabled)
         if self._todoist and self.config['todoist']['enabled']:
-            tasks.extend(self._get_todoist_tasks())
+            fetchers.append(self._get_todoist_tasks)
 
         # Get tasks from daily note
-        tasks.extend(self._get_daily_note_tasks())
+        fetchers.append(self._get_daily_note_tasks)
+
+        tasks = []
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = [executor.submit(fetch) for fetch in fetchers]
+            for future in futures:
+                tasks.extend(future.result())
 
         self.logger.info(f"Found {len(tasks)} total tasks")
-        return tasks
+
+        tasks_by_id = {}
+        for task in tasks:
+            tasks_by_id.setdefault(task.id, task)  # first task with an ID wins
+        self._task_cache = (time.monotonic(), tasks, tasks_by_id)
+
+        return self._copy_tasks(tasks)
+
+    def _get_cached_tasks(self) -> Optional[Tuple[List[Task], Dict[str, Task]]]:
+        """Return (tasks, tasks_by_id) from the aggregate cache if still fresh"""
+        if self._task_cache is None:
+            return None
+
+        cached_at, tasks, tasks_by_id = self._task_cache
+        if time.monotonic() - cached_at >= self.config.get('cache_ttl', 60):
+            self._task_cache = None
+            return None
+
+        return tasks, tasks_by_id
+
+    def _get_unique_tasks(self) -> List[Task]:
+        """Deduplicated tasks for the current aggregate cache entry (computed at most once per fetch)"""
+        if self._get_cached_tasks() is None:
+            self.aggregate_tasks()
+        cached_at = self._task_cache[0]
+
+        if self._unique_task_cache is None or self._unique_task_cache[0] != cached_at:
+            # deduplicate_tasks merges in place, so run it over copies
+            unique = self.deduplicate_tasks(self._copy_tasks(self._task_cache[1]))
+            self._unique_task_cache = (cached_at, unique)
+
+        return self._unique_task_cache[1]
+
+    @staticmethod
+    def _copy_tasks(tasks: List[Task]) -> List[Task]:
+        """Copy tasks (including the mutable source_systems/metadata) for callers to mutate"""
+        return [
+            replace(task, source_systems=list(task.source_systems), metadata=dict(task.metadata))
+            for task in tasks
+        ]
 
     def deduplicate_tasks(self, tasks: List[Task]) -> List[Task]:
         """
         Deduplicate tasks using heuristic matching
 
         Strategy:
-        1. Exact title match → merge immediately
+        1. Exact match on _dedup_key (case and punctuation insensitive) → merge immediately
         2. Fuzzy match (>80% similar) → merge
         3. For duplicates: merge source_systems, combine metadata
 
+        Similarity uses rapidfuzz when installed (best match wins; with numpy
+        all pairs are scored up front via process.cdist), otherwise
+        difflib.SequenceMatcher (first match wins). autojunk is disabled: its
+        popular-character heuristic misjudges titles built from shared
+        templates. Each task is only compared against tasks that are
+        themselves unique, so duplicates never chain.
+        Without the precomputed matrix, candidates are blocked by shared title
+        bigrams (short titles are always compared). The blocking never drops
+        a pair the scorer in use would merge at the 80% threshold. The paths
+        themselves can still differ: fuzz.ratio and SequenceMatcher.ratio
+        score some pairs on opposite sides of the threshold.
+
         Args:
             tasks: List of tasks potentially containing duplicates
 
         Returns:
             List of unique tasks
         """
-        from difflib import SequenceMatcher
-
         if not tasks:
             return []
 
         self.logger.info(f"Deduplicating {len(tasks)} tasks...")
 
-        # Track unique tasks and duplicates
+        norms = [_dedup_key(task.title) for task in tasks]
+
+        # With rapidfuzz + numpy, score every pair in one multi-threaded C++
+        # call; cells below the threshold come back as 0
+        sim_matrix = None
+        if fuzz_process is not None and _HAS_NUMPY:
+            import numpy as np
+
+            sim_matrix = fuzz_process.cdist(
+                norms, norms, scorer=fuzz.ratio, dtype=np.uint8,
+                score_cutoff=FUZZY_MATCH_THRESHOLD, workers=-1
+            )
+
+        # Track unique tasks (their normalized titles and input positions) and duplicates
         unique_tasks = []
+        unique_norms = []
+        unique_positions = []
+        unique_by_norm = {}  # normalized title → index into unique_tasks
+
+        # Blocking index (only needed without a precomputed matrix): unique
+        # tasks by title bigram, so fuzzy scoring only sees titles sharing
+        # at least one 2-character run - which every possible match does (see
+        # _BLOCKING_SHORT_TITLE_LEN). Short titles are always compared.
+        bigram_index = {}
+        short_unique = []
         merged_count = 0
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for pos, task in enumerate(tasks):
+            norm = norms[pos]
+            # Exact match on the dedup key - O(1) dict lookup
+            match_idx = unique_by_norm.get(norm)
+            similarity = 1.0
+            grams = _bigrams(norm) if sim_matrix is None else set()
+
+            if match_idx is None:
+                candidates = None
+                if sim_matrix is None:
+                    blocked = set(short_unique)
+                    for gram in grams:
+                        blocked.update(bigram_index.get(gram, ()))
+                    candidates = sorted(blocked)
+
+                # No exact (case-insensitive) match - fall back to fuzzy scoring
+                match_idx, similarity = self._find_fuzzy_match(
+                    pos, norm, unique_norms, unique_positions, sim_matrix, candidates
+                )
 
-        for task in tasks:
-            # Check if this task is a duplicate of an existing unique task
-            is_duplicate = False
-
-            for unique_task in unique_tasks:
-                # Check for exact match (case-insensitive)
-                if task.title.lower().strip() == unique_task.title.lower().strip():
-                    # Exact match - merge source systems
-                    self._merge_duplicate(unique_task, task)
-                    is_duplicate = True
-                    merged_count += 1
+            # If not a duplicate, add to unique list
+            if match_idx is None:
+                unique_idx = len(unique_tasks)
+                unique_by_norm.setdefault(norm, unique_idx)
+                if sim_matrix is None:
+                    if len(norm) <= _BLOCKING_SHORT_TITLE_LEN:
+                        short_unique.append(unique_idx)
+                    else:
+                        for gram in grams:
+                            bigram_index.setdefault(gram, []).append(unique_idx)
+                unique_tasks.append(task)
+                unique_norms.append(norm)
+                unique_positions.append(pos)
+                continue
+
+            unique_task = unique_tasks[match_idx]
+            self._merge_duplicate(unique_task, task)
+            merged_count += 1
+
+            if debug:
+                if norm == unique_norms[match_idx]:
                     self.logger.debug(f"Exact match: '{task.title[:40]}' (merged into existing)")
-                    break
-
-                # Check for fuzzy match (80% similarity threshold)
-                similarity = SequenceMatcher(
-                    None,
-                    task.title.lower().strip(),
-                    unique_task.title.lower().strip()
-                ).ratio()
-
-                if similarity >= 0.80:
-                    # High similarity - merge
-                    self._merge_duplicate(unique_task, task)
-                    is_duplicate = True
-                    merged_count += 1
+                else:
                     self.logger.debug(
                         f"Fuzzy match ({similarity:.2f}): "
                         f"'{task.title[:40]}' ≈ '{unique_task.title[:40]}' (merged)"
                     )
-                    break
-
-            # If not a duplicate, add to unique list
-            if not is_duplicate:
-                unique_tasks.append(task)
 
         self.logger.info(
             f"Deduplication complete: {len(tasks)} → {len(unique_tasks)} "
@@ -218,6 +494,87 @@ class TaskManager:
 
         return unique_tasks
 
+    def _find_fuzzy_match(
+        self,
+        pos: int,
+        norm: str,
+        unique_norms: List[str],
+        unique_positions: List[int],
+        sim_matrix: Optional[Any] = None,
+        candidates: Optional[List[int]] = None
+    ) -> Tuple[Optional[int], float]:
+        """
+        Find the unique task a title fuzzy-matches, if any
+
+        Args:
+            pos: Position of the task in the deduplication input
+            norm: Normalized title of the task
+            unique_norms: Normalized titles of the unique tasks so far
+            unique_positions: Input positions of the unique tasks so far
+            sim_matrix: Precomputed all-pairs similarity matrix (0-100), if any
+            candidates: Ascending indices into unique tasks worth scoring
+                (default: all of them); ignored when sim_matrix is given
+
+        Returns:
+            (index into unique tasks, similarity 0-1), or (None, 0.0) if no match
+        """
+        if not unique_norms:
+            return None, 0.0
+
+        if sim_matrix is not None:
+            # Best-scoring unique task so far (ties → earliest)
+            row = sim_matrix[pos, unique_positions]
+            best = int(row.argmax())
+            if row[best] >= FUZZY_MATCH_THRESHOLD:
+                return best, row[best] / 100
+            return None, 0.0
+
+        if candidates is None:
+            candidates = range(len(unique_norms))
+        elif not candidates:
+            return None, 0.0
+
+        if fuzz_process is not None:
+            # One C-level scan over the candidate titles; returns the best
+            # match at or above the threshold
+            choices = {idx: unique_norms[idx] for idx in candidates}
+            hit = fuzz_process.extractOne(
+                norm, choices, scorer=fuzz.ratio, score_cutoff=FUZZY_MATCH_THRESHOLD
+            )
+            if hit is not None:
+                _, score, idx = hit
+                return idx, score / 100
+            return None, 0.0
+
+        threshold = FUZZY_MATCH_THRESHOLD / 100
+        norm_len = len(norm)
+
+        # SequenceMatcher caches its index of seq2, so the incoming title is
+        # seq2 and only seq1 changes per candidate
+        matcher = SequenceMatcher(autojunk=False)
+        matcher.set_seq2(norm)
+
+        for idx in candidates:
+            unique_norm = unique_norms[idx]
+
+            # ratio() is at most 2*min(len)/(total len): skip pairs whose
+            # lengths alone rule out a match, without scoring them
+            unique_len = len(unique_norm)
+            if 2 * min(norm_len, unique_len) * 100 < FUZZY_MATCH_THRESHOLD * (norm_len + unique_len):
+                continue
+
+            # Check for fuzzy match (80% similarity threshold); quick_ratio()
+            # is a cheap upper bound on ratio()
+            matcher.set_seq1(unique_norm)
+            if matcher.quick_ratio() < threshold:
+                continue
+
+            ratio = matcher.ratio()
+            if ratio >= threshold:
+                return idx, ratio
+
+        return None, 0.0
+
     def _merge_duplicate(self, existing: Task, duplicate: Task) -> None:
         """
         Merge a duplicate task into an existing task
@@ -228,10 +585,11 @@ class TaskManager:
             existing: The task to merge into (modified in-place)
             duplicate: The duplicate task to merge from
         """
-        # Merge source systems (unique values only)
-        for source in duplicate.source_systems:
-            if source not in existing.source_systems:
-                existing.source_systems.append(source)
+        # Merge source systems (unique values only, order preserved)
+        known = set(existing.source_systems)
+        existing.source_systems.extend(
+            source for source in dict.fromkeys(duplicate.source_systems) if source not in known
+        )
 
         # Merge metadata (preserve both)
         if duplicate.metadata:
@@ -276,29 +634,85 @@ class TaskManager:
             P1 task + high energy + has deadline = 5 × 2.0 × 1.5 = 15.0
             P3 task + low energy + no deadline = 3 × 1.0 × 1.0 = 3.0
         """
+        has_deadline = bool(task.due_date)
+        score = self._tax_table.get((task.priority, task.energy, has_deadline))
+        if score is None:
+            # Priority/energy outside the precomputed combinations
+            score = self._attention_tax_score(task.priority, task.energy, has_deadline)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Attention Tax for '{task.title[:30]}': "
+                f"{task.priority} × {task.energy} × {'deadline' if has_deadline else 'no deadline'} = {score}"
+            )
+
+        return score
+
+    def apply_attention_tax(self, tasks: List[Task]) -> None:
+        """
+        Set attention_tax on every task in one batch
+
+        Same scores as calculate_attention_tax, but with the table lookup
+        inlined so large task lists don't pay a method call (and debug-log
+        formatting) per task.
+
+        Args:
+            tasks: Tasks to score (modified in-place)
+        """
+        table = self._tax_table
+        score_fn = self._attention_tax_score
+
+        for task in tasks:
+            key = (task.priority, task.energy, bool(task.due_date))
+            score = table.get(key)
+            task.attention_tax = score if score is not None else score_fn(*key)
+
+    def _attention_tax_score(self, priority: str, energy: str, has_deadline: bool) -> float:
+        """Attention Tax for one (priority, energy, has_deadline) combination"""
         config = self.config['attention_tax']
 
         # Get base priority score
-        priority_score = config['priority_base'].get(task.priority, 2)
+        priority_score = config['priority_base'].get(priority, 2)
 
         # Get energy multiplier
-        energy_mult = config['energy_multiplier'].get(task.energy, 1.0)
+        energy_mult = config['energy_multiplier'].get(energy, 1.0)
 
         # Get deadline multiplier
         deadline_mult = (
             config['deadline_multiplier']['has_deadline']
-            if task.due_date
+            if has_deadline
             else config['deadline_multiplier']['no_deadline']
         )
 
-        score = priority_score * energy_mult * deadline_mult
+        return priority_score * energy_mult * deadline_mult
 
-        self.logger.debug(
-            f"Attention Tax for '{task.title[:30]}': "
-            f"{priority_score} × {energy_mult} × {deadline_mult} = {score}"
-        )
+    def _build_attention_tax_table(self) -> Dict[Tuple[str, str, bool], float]:
+        """
+        Precompute Attention Tax for every priority × energy × deadline combination
 
-        return score
+        There are only 4 × 3 × 2 of them, so scoring a task becomes one dict lookup.
+        """
+        return {
+            (priority, energy, has_deadline): self._attention_tax_score(priority, energy, has_deadline)
+            for priority in PRIORITIES
+            for energy in LEVELS
+            for has_deadline in (True, False)
+        }
+
+    @staticmethod
+    def _compile_any_of(literals) -> Optional[re.Pattern]:
+        """
+        Compile literal strings (urgent keywords, critical tags) into one alternation regex
+
+        One scan of the text finds any of them, instead of a substring
+        search per literal. Empty literals are dropped. Returns None when
+        there are none left.
+        """
+        # An empty literal would match every text
+        literals = [literal for literal in literals if literal]
+        if not literals:
+            return None
+        return re.compile('|'.join(re.escape(literal) for literal in literals))
 
     def recommend_next_actions(
         self,
@@ -329,8 +743,7 @@ class TaskManager:
         )
 
         # Get all tasks
-        all_tasks = self.aggregate_tasks()
-        all_tasks = self.deduplicate_tasks(all_tasks)
+        all_tasks = self.aggregate_tasks(deduplicate=True)
 
         # Filter out backlog tasks (deferred for future consideration)
         backlog_count = 0
@@ -348,15 +761,17 @@ class TaskManager:
         all_tasks = filtered_tasks
 
         # Calculate attention tax for each
-        for task in all_tasks:
-            task.attention_tax = self.calculate_attention_tax(task)
+        self.apply_attention_tax(all_tasks)
 
         # Identify critical tasks (overrides capacity)
         critical_tasks = self._identify_critical_tasks(all_tasks)
         self.logger.info(f"Found {len(critical_tasks)} critical tasks")
 
-        # Filter by capacity match (excluding already-critical tasks)
-        non_critical = [t for t in all_tasks if t not in critical_tasks]
+        # Filter by capacity match (excluding already-critical tasks).
+        # Membership is by object identity: a set lookup instead of a list
+        # scan (and dataclass field-by-field __eq__) per task
+        critical_ids = {id(t) for t in critical_tasks}
+        non_critical = [t for t in all_tasks if id(t) not in critical_ids]
         matched_tasks = self._filter_by_capacity(non_critical, capacity)
 
         self.logger.info(
@@ -364,12 +779,10 @@ class TaskManager:
             f"(from {len(non_critical)} non-critical tasks)"
         )
 
-        # Sort by Attention Tax (LOWEST first - easiest wins when tired)
-        matched_tasks.sort(key=lambda t: t.attention_tax)
-
-        # Return top N
+        # Top N by Attention Tax (LOWEST first - easiest wins when tired);
+        # a bounded heap avoids sorting tasks that won't be shown
         min_tasks = self.config['recommendations']['min_tasks']
-        recommendations = matched_tasks[:max_tasks]
+        recommendations = heapq.nsmallest(max_tasks, matched_tasks, key=_by_attention_tax)
 
         # If we don't have enough matches, fill with lowest-tax tasks regardless of capacity
         if len(recommendations) < min_tasks:
@@ -377,10 +790,13 @@ class TaskManager:
                 f"Only {len(recommendations)} capacity matches, "
                 f"adding low-tax tasks to reach minimum of {min_tasks}"
             )
-            non_critical.sort(key=lambda t: t.attention_tax)
-            for task in non_critical:
-                if task not in recommendations:
+            # The min_tasks lowest-tax candidates always contain enough tasks
+            # not already recommended
+            recommended_ids = {id(t) for t in recommendations}
+            for task in heapq.nsmallest(min_tasks, non_critical, key=_by_attention_tax):
+                if id(task) not in recommended_ids:
                     recommendations.append(task)
+                    recommended_ids.add(id(task))
                     if len(recommendations) >= min_tasks:
                         break
 
@@ -411,23 +827,24 @@ class TaskManager:
         Returns:
             Tasks that are at or below current capacity
         """
-        energy_levels = {'low': 0, 'medium': 1, 'high': 2}
-        attention_levels = {'low': 0, 'medium': 1, 'high': 2}
+        capacity_energy_level = LEVEL_RANK[capacity.energy]
+        capacity_attention_level = LEVEL_RANK[capacity.attention]
+
+        # STRICT: Task requirements must be <= your capacity in both
+        # dimensions. There are only 3 x 3 (energy, attention) pairs, so
+        # resolve the allowed ones once and each task is a single set lookup
+        allowed = {
+            (energy, attention)
+            for energy, energy_level in LEVEL_RANK.items()
+            if energy_level <= capacity_energy_level
+            for attention, attention_level in LEVEL_RANK.items()
+            if attention_level <= capacity_attention_level
+        }
 
-        capacity_energy_level = energy_levels[capacity.energy]
-        capacity_attention_level = attention_levels[capacity.attention]
+        matched = [task for task in tasks if (task.energy, task.attention) in allowed]
 
-        matched = []
-
-        for task in tasks:
-            task_energy_level = energy_levels[task.energy]
-            task_attention_level = attention_levels[task.attention]
-
-            # STRICT: Task requirements must be <= your capacity
-            # Don't show tasks that require MORE than you have
-            if (task_energy_level <= capacity_energy_level and
-                task_attention_level <= capacity_attention_level):
-                matched.append(task)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for task in matched:
                 self.logger.debug(
                     f"Match: '{task.title[:30]}' "
                     f"(task: {task.energy}/{task.attention}, "
@@ -452,44 +869,40 @@ class TaskManager:
         Returns:
             List of critical tasks sorted by due date (soonest first)
         """
-        config = self.config['critical_tasks']
         critical = []
-        now = datetime.now()
+        today = date.today()
 
         for task in tasks:
             is_critical = False
             reasons = []
 
-            # Check due date
+            # Check due date (by calendar date, so tz-aware and naive due dates both work)
             if task.due_date:
-                days_until_due = (task.due_date - now).days
-                if days_until_due <= config['due_within_days']:
+                days_until_due = _days_until(task.due_date, today)
+                if days_until_due <= self._critical_due_days:
                     is_critical = True
                     reasons.append(f"due in {days_until_due} days")
 
             # Check P1 with deadline
-            if (config['p1_with_deadline_critical'] and
+            if (self._critical_p1_with_deadline and
                 task.priority == 'P1' and
                 task.due_date):
                 is_critical = True
                 reasons.append("P1 with deadline")
 
             # Check urgent keywords in title
-            title_lower = task.title.lower()
-            for keyword in config['urgent_keywords']:
-                if keyword in title_lower:
+            if self._urgent_keyword_re is not None:
+                match = self._urgent_keyword_re.search(_normalize_title(task.title))
+                if match:
                     is_critical = True
-                    reasons.append(f"contains '{keyword}'")
-                    break
+                    reasons.append(f"contains '{match.group()}'")
 
             # Check critical tags in metadata
-            if task.metadata and 'raw_line' in task.metadata:
-                raw_line = task.metadata['raw_line']
-                for tag in config['critical_tags']:
-                    if f'#{tag}' in raw_line:
-                        is_critical = True
-                        reasons.append(f"has #{tag}")
-                        break
+            if self._critical_tag_re is not None and task.metadata and 'raw_line' in task.metadata:
+                match = self._critical_tag_re.search(task.metadata['raw_line'])
+                if match:
+                    is_critical = True
+                    reasons.append(f"has {match.group()}")
 
             if is_critical:
                 self.logger.info(
@@ -499,7 +912,7 @@ class TaskManager:
 
         # Sort critical tasks by due date (soonest first)
         critical.sort(key=lambda t: (
-            t.due_date if t.due_date else datetime.max,
+            _due_sort_key(t.due_date),
             -t.attention_tax  # Secondary sort by tax if same due date
         ))
 
@@ -516,70 +929,112 @@ class TaskManager:
         Returns:
             True if at least one system updated successfully, False otherwise
         """
-        self.logger.info(f"Marking task {task_id} complete...")
+        return self.mark_complete_many([task_id], systems)[task_id]
 
-        # Get all tasks to find this one
-        all_tasks = self.aggregate_tasks()
+    def mark_complete_many(
+        self,
+        task_ids: List[str],
+        systems: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """
+        Mark several tasks complete, with one batched call per integration
 
-        # Find the task
-        target_task = None
-        for task in all_tasks:
-            if task.id == task_id:
-                target_task = task
-                break
+        Tasks are looked up once (via the aggregate cache), then all Todoist
+        completions are queued in one append and all Obsidian tasks are
+        checked off in one read/write of the task database.
 
-        if not target_task:
-            self.logger.error(f"Task not found: {task_id}")
-            return False
+        Args:
+            task_ids: Unique task identifiers
+            systems: List of systems to update (default: all source systems for each task)
 
-        # Determine which systems to update
-        if systems is None:
-            systems = target_task.source_systems
+        Returns:
+            Dict mapping each task ID to True if at least one system updated
+            successfully, False otherwise
+        """
+        # Find the tasks (by ID, via the aggregate cache)
+        cached = self._get_cached_tasks()
+        if cached is None:
+            self.aggregate_tasks()
+            # Read the entry just stored rather than re-checking its TTL,
+            # which has already expired when cache_ttl is 0
+            cached = self._task_cache[1:]
+        tasks_by_id = cached[1]
+
+        # Determine which systems to update for each task
+        targets = {}
+        for task_id in task_ids:
+            self.logger.info(f"Marking task {task_id} complete...")
+            target_task = tasks_by_id.get(task_id)
+            if not target_task:
+                self.logger.error(f"Task not found: {task_id}")
+                continue
 
-        self.logger.info(
-            f"Marking '{target_task.title[:50]}' complete in: {', '.join(systems)}"
-        )
+            task_systems = systems if systems is not None else target_task.source_systems
+            self.logger.info(
+                f"Marking '{target_task.title[:50]}' complete in: {', '.join(task_systems)}"
+            )
+            targets[task_id] = (target_task, task_systems)
 
-        # Track success
-        success_count = 0
-        total_count = len(systems)
+        # One batched call per integration
+        todoist_ids = [task_id for task_id, (_, task_systems) in targets.items() if 'todoist' in task_systems]
+        obsidian_titles = {
+            task_id: task.title for task_id, (task, task_systems) in targets.items() if 'obsidian' in task_systems
+        }
 
-        # Update each system
-        for system in systems:
-            if system == 'todoist':
-                if self._todoist and self._todoist.mark_complete(task_id):
-                    success_count += 1
-                    self.logger.info(f"✅ Marked complete in Todoist")
-                else:
-                    self.logger.warning(f"⚠️  Failed to mark complete in Todoist")
+        todoist_done = {}
+        if todoist_ids and self._todoist:
+            todoist_done = self._todoist.mark_complete_many(todoist_ids)
+        obsidian_done = self._obsidian.mark_complete_many(obsidian_titles) if obsidian_titles else {}
+
+        results = {task_id: False for task_id in task_ids}
+        any_success = False
+
+        for task_id, (target_task, task_systems) in targets.items():
+            # Track success
+            success_count = 0
+            total_count = len(task_systems)
+
+            for system in task_systems:
+                if system == 'todoist':
+                    if todoist_done.get(task_id):
+                        success_count += 1
+                        self.logger.info(f"✅ Marked complete in Todoist")
+                    else:
+                        self.logger.warning(f"⚠️  Failed to mark complete in Todoist")
+
+                elif system == 'obsidian':
+                    if obsidian_done.get(task_id):
+                        success_count += 1
+                        self.logger.info(f"✅ Marked complete in Obsidian")
+                    else:
+                        self.logger.warning(f"⚠️  Failed to mark complete in Obsidian")
 
-            elif system == 'obsidian':
-                if self._obsidian.mark_complete(target_task.title):
+                elif system == 'daily_note':
+                    # Daily note tasks are transient - just log
+                    self.logger.info(f"ℹ️  Daily note tasks are transient (no action needed)")
                     success_count += 1
-                    self.logger.info(f"✅ Marked complete in Obsidian")
-                else:
-                    self.logger.warning(f"⚠️  Failed to mark complete in Obsidian")
 
-            elif system == 'daily_note':
-                # Daily note tasks are transient - just log
-                self.logger.info(f"ℹ️  Daily note tasks are transient (no action needed)")
-                success_count += 1
+                else:
+                    self.logger.warning(f"Unknown system: {system}")
 
+            # Report results
+            if success_count == total_count:
+                self.logger.info(f"✅ Task marked complete in all {total_count} systems")
+            elif success_count > 0:
+                self.logger.warning(
+                    f"⚠️  Task marked complete in {success_count}/{total_count} systems"
+                )
             else:
-                self.logger.warning(f"Unknown system: {system}")
+                self.logger.error(f"❌ Failed to mark task complete in any system")
 
-        # Report results
-        if success_count == total_count:
-            self.logger.info(f"✅ Task marked complete in all {total_count} systems")
-            return True
-        elif success_count > 0:
-            self.logger.warning(
-                f"⚠️  Task marked complete in {success_count}/{total_count} systems"
-            )
-            return True
-        else:
-            self.logger.error(f"❌ Failed to mark task complete in any system")
-            return False
+            results[task_id] = success_count > 0
+            any_success = any_success or success_count > 0
+
+        # Source data changed - don't serve completed tasks from cache
+        if any_success:
+            self._task_cache = None
+
+        return results
 
     def sync_daily_note(self, date: Optional[datetime] = None) -> bool:
         """
@@ -614,7 +1069,7 @@ class TaskManager:
         tasks_section = self._generate_daily_tasks_markdown(critical_tasks, recommended_tasks)
 
         # Read current daily note
-        content = daily_note_path.read_text()
+        content = self._obsidian.read_daily_note(daily_note_path)
 
         # Find position for Tasks section (between Planning and Notes)
         # Check if ## Tasks already exists
@@ -634,6 +1089,13 @@ class TaskManager:
 
         return True
 
+    def _task_database_uri(self) -> str:
+        """Obsidian URI that opens the task database in its vault"""
+        vault_path = self._obsidian.vault_path
+        task_db_path = self._obsidian.task_database.relative_to(vault_path)
+        encoded_path = urllib.parse.quote(str(task_db_path))
+        return f"obsidian://open?vault={urllib.parse.quote(vault_path.name)}&file={encoded_path}"
+
     def _generate_daily_tasks_markdown(self, critical_tasks: List[Task], recommended_tasks: List[Task]) -> str:
         """
         Generate markdown for the ## Tasks section in daily note
@@ -645,13 +1107,13 @@ class TaskManager:
         Returns:
             Markdown string for tasks section
         """
-        import urllib.parse
-
         lines = ["## Tasks", ""]
 
-        # Get vault name from config (for Obsidian URIs)
-        vault_path = self._obsidian.vault_path
-        vault_name = vault_path.name
+        # Obsidian URI for source links (same for every task)
+        task_db_uri = self._task_database_uri()
+
+        # One reference date for every "due in N days" label
+        today = date.today()
 
         # Critical tasks section
         if critical_tasks:
@@ -666,21 +1128,17 @@ class TaskManager:
                 # Metadata line
                 meta_parts = []
                 if task.due_date:
-                    days_until = (task.due_date - datetime.now()).days
+                    days_until = _days_until(task.due_date, today)
                     if days_until < 0:
-                        meta_parts.append(f"**Due**: {task.due_date.strftime('%Y-%m-%d')} (⚠️ OVERDUE by {abs(days_until)} days)")
+                        meta_parts.append(f"**Due**: {_format_due(task.due_date)} (⚠️ OVERDUE by {abs(days_until)} days)")
                     else:
-                        meta_parts.append(f"**Due**: {task.due_date.strftime('%Y-%m-%d')} (in {days_until} days)")
+                        meta_parts.append(f"**Due**: {_format_due(task.due_date)} (in {days_until} days)")
 
                 meta_parts.append(f"**Tax**: {task.attention_tax:.1f}")
 
                 # Source link
                 if 'obsidian' in task.source_systems:
-                    # Generate Obsidian URI
-                    task_db_path = self._obsidian.task_database.relative_to(vault_path)
-                    encoded_path = urllib.parse.quote(str(task_db_path))
-                    uri = f"obsidian://open?vault={urllib.parse.quote(vault_name)}&file={encoded_path}"
-                    meta_parts.append(f"**Source**: [Tasks]({uri})")
+                    meta_parts.append(f"**Source**: [Tasks]({task_db_uri})")
                 else:
                     source_name = ', '.join(task.source_systems)
                     meta_parts.append(f"**Source**: {source_name}")
@@ -702,14 +1160,11 @@ class TaskManager:
                 meta_parts = [f"**Tax**: {task.attention_tax:.1f}"]
 
                 if task.due_date:
-                    meta_parts.append(f"**Due**: {task.due_date.strftime('%Y-%m-%d')}")
+                    meta_parts.append(f"**Due**: {_format_due(task.due_date)}")
 
                 # Source link
                 if 'obsidian' in task.source_systems:
-                    task_db_path = self._obsidian.task_database.relative_to(vault_path)
-                    encoded_path = urllib.parse.quote(str(task_db_path))
-                    uri = f"obsidian://open?vault={urllib.parse.quote(vault_name)}&file={encoded_path}"
-                    meta_parts.append(f"**Source**: [Tasks]({uri})")
+                    meta_parts.append(f"**Source**: [Tasks]({task_db_uri})")
                 else:
                     source_name = ', '.join(task.source_systems)
                     meta_parts.append(f"**Source**: {source_name}")
@@ -734,16 +1189,13 @@ class TaskManager:
         Returns:
             Updated content
         """
-        import re
-
         # Try to find ## Planning and ## Notes
         # Insert Tasks section between them
-        pattern = r'(## Planning.*?)(\n## Notes)'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _PLANNING_SECTION_RE.search(content)
 
         if match:
             # Insert between Planning and Notes
-            return content[:match.end(1)] + '\n\n' + tasks_section + '\n' + content[match.end(1):]
+            return content[:match.end()] + '\n\n' + tasks_section + '\n' + content[match.end():]
         else:
             # Fallback: add at end
             self.logger.warning("Could not find ## Planning and ## Notes sections, appending tasks to end")
@@ -760,11 +1212,8 @@ class TaskManager:
         Returns:
             Updated content with preserved checkboxes
         """
-        import re
-
         # Find the existing ## Tasks section
-        pattern = r'## Tasks\n.*?(?=\n## [^T]|\Z)'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _TASKS_SECTION_RE.search(content)
 
         if not match:
             # No existing section found, insert new one
@@ -774,26 +1223,18 @@ class TaskManager:
         old_section = match.group(0)
 
         # Find all checked tasks in old section (preserve completions)
-        checked_tasks = set()
-        for line in old_section.split('\n'):
-            if line.strip().startswith('- [x]'):
-                # Extract task title
-                task_match = re.match(r'- \[x\] \*\*(.+?)\*\*', line)
-                if task_match:
-                    checked_tasks.add(task_match.group(1))
+        checked_tasks = set(_CHECKED_TASK_RE.findall(old_section))
 
         # Update new section to preserve checked boxes
-        new_lines = []
-        for line in new_tasks_section.split('\n'):
-            if line.strip().startswith('- [ ]'):
-                # Check if this task was completed
-                task_match = re.match(r'- \[ \] \*\*(.+?)\*\*', line)
-                if task_match and task_match.group(1) in checked_tasks:
-                    # Mark as checked
-                    line = line.replace('- [ ]', '- [x]', 1)
-            new_lines.append(line)
-
-        updated_section = '\n'.join(new_lines)
+        def keep_checked(task_match):
+            line_start = task_match.group(0)
+            if task_match.group(1) in checked_tasks:
+                return '- [x]' + line_start[len('- [ ]'):]
+            return line_start
+
+        updated_section = (
+            _UNCHECKED_TASK_RE.sub(keep_checked, new_tasks_section) if checked_tasks else new_tasks_section
+        )
 
         # Replace old section with updated section
         return content[:match.start()] + updated_section + content[match.end():]
@@ -823,7 +1264,7 @@ class TaskManager:
         self.logger.info(f"Syncing completions from daily note: {daily_note_path.name}")
 
         # Read daily note
-        content = daily_note_path.read_text()
+        content = self._obsidian.read_daily_note(daily_note_path)
 
         # Extract checked tasks from ## Tasks section
         checked_tasks = self._extract_checked_tasks(content)
@@ -837,26 +1278,32 @@ class TaskManager:
         # Get all tasks to match against
         all_tasks = self.aggregate_tasks()
 
-        # Match checked tasks to actual task objects and mark complete
+        # Index tasks by normalized title once (first task with a title wins)
+        tasks_by_title = {}
+        for task in all_tasks:
+            tasks_by_title.setdefault(_normalize_title(task.title), task)
+
+        # Match checked tasks to actual task objects
         completed = 0
         failed = 0
+        matched = []
 
         for task_title in checked_tasks:
             # Find matching task
-            matching_task = None
-            for task in all_tasks:
-                if task.title.lower().strip() == task_title.lower().strip():
-                    matching_task = task
-                    break
+            matching_task = tasks_by_title.get(_normalize_title(task_title))
 
             if not matching_task:
                 self.logger.warning(f"Could not find task: {task_title[:50]}...")
                 failed += 1
                 continue
 
-            # Mark complete in source systems
-            success = self.mark_complete(matching_task.id)
-            if success:
+            matched.append((task_title, matching_task.id))
+
+        # Mark complete in source systems, batched across all checked tasks
+        results = self.mark_complete_many([task_id for _, task_id in matched]) if matched else {}
+
+        for task_title, task_id in matched:
+            if results[task_id]:
                 completed += 1
                 self.logger.info(f"✅ Marked complete: {task_title[:50]}...")
             else:
@@ -875,27 +1322,14 @@ class TaskManager:
         Returns:
             List of task titles that are checked
         """
-        import re
-
         # Find the ## Tasks section
-        pattern = r'## Tasks\n.*?(?=\n## [^T]|\Z)'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _TASKS_SECTION_RE.search(content)
 
         if not match:
             return []
 
-        tasks_section = match.group(0)
-
         # Find all checked tasks: - [x] **Task Title** ...
-        checked_tasks = []
-        for line in tasks_section.split('\n'):
-            if line.strip().startswith('- [x]'):
-                # Extract task title
-                task_match = re.match(r'- \[x\] \*\*(.+?)\*\*', line)
-                if task_match:
-                    checked_tasks.append(task_match.group(1))
-
-        return checked_tasks
+        return _CHECKED_TASK_RE.findall(match.group(0))
 
     def sync_dashboard(self) -> bool:
         """
@@ -918,18 +1352,34 @@ class TaskManager:
         self.logger.info(f"Syncing task dashboard: {dashboard_path}")
 
         # Get all tasks
-        all_tasks = self.aggregate_tasks()
-        deduplicated_tasks = self.deduplicate_tasks(all_tasks)
+        deduplicated_tasks = self.aggregate_tasks(deduplicate=True)
 
         # Calculate attention tax and stats
-        for task in deduplicated_tasks:
-            task.attention_tax = self.calculate_attention_tax(task)
+        self.apply_attention_tax(deduplicated_tasks)
 
         # Generate dashboard markdown
         dashboard_content = self._generate_dashboard_markdown(deduplicated_tasks)
 
-        # Write to file
-        dashboard_path.write_text(dashboard_content)
+        # Skip the write when nothing but the timestamp changed, so Obsidian
+        # doesn't re-index an otherwise identical file
+        try:
+            old_content = dashboard_path.read_text(encoding='utf-8')
+        except (FileNotFoundError, UnicodeDecodeError):
+            old_content = None
+        if old_content is not None and (
+            _without_updated_stamp(old_content) == _without_updated_stamp(dashboard_content)
+        ):
+            self.logger.info("Dashboard already up to date")
+            return True
+
+        # Write to a temp file and rename over the dashboard, so a reader
+        # never sees it half-written; a failed write leaves no temp file behind
+        tmp_path = dashboard_path.with_name(dashboard_path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(dashboard_content.encode('utf-8'))
+            os.replace(tmp_path, dashboard_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
         self.logger.info(f"✅ Dashboard updated with {len(deduplicated_tasks)} tasks")
 
@@ -945,71 +1395,52 @@ class TaskManager:
         Returns:
             Markdown string for dashboard
         """
-        import urllib.parse
-
         lines = ["# Task Dashboard", ""]
 
-        # Get vault name from config (for Obsidian URIs)
-        vault_path = self._obsidian.vault_path
-        vault_name = vault_path.name
+        # Obsidian URI for source links (same for every task)
+        task_db_uri = self._task_database_uri()
 
         # Stats header
         now = datetime.now()
         critical_tasks = self._identify_critical_tasks(tasks)
-        overdue_tasks = [t for t in tasks if t.due_date and t.due_date < now]
+        today = now.date()
+        overdue_tasks = [t for t in tasks if t.due_date and _days_until(t.due_date, today) < 0]
 
-        lines.append(f"*Last updated: {now.strftime('%Y-%m-%d %H:%M')}*")
+        lines.append(f"{_DASHBOARD_UPDATED_PREFIX}{now.strftime('%Y-%m-%d %H:%M')}*")
         lines.append(f"*Total: {len(tasks)} tasks | Critical: {len(critical_tasks)} | Overdue: {len(overdue_tasks)}*")
         lines.append("")
         lines.append("---")
         lines.append("")
 
-        # Group tasks by priority
-        by_priority = {
-            'P1': [],
-            'P2': [],
-            'P3': [],
-            'P4': []
-        }
+        # Group tasks by priority, and by source within each priority, in one pass
+        by_priority = {priority: {} for priority in PRIORITIES}
+        priority_counts = Counter()
 
         for task in tasks:
-            priority = task.priority
-            if priority in by_priority:
-                by_priority[priority].append(task)
+            by_source = by_priority.get(task.priority)
+            if by_source is None:
+                continue
+            priority_counts[task.priority] += 1
+            for source in task.source_systems:
+                by_source.setdefault(source, []).append(task)
 
         # Generate sections for each priority
-        priority_labels = {
-            'P1': '🔴 P1 Tasks (Urgent)',
-            'P2': '🟡 P2 Tasks (High)',
-            'P3': '🟢 P3 Tasks (Normal)',
-            'P4': '🔵 P4 Tasks (Low)'
-        }
-
-        for priority in ['P1', 'P2', 'P3', 'P4']:
-            priority_tasks = by_priority[priority]
-
-            if not priority_tasks:
+        for priority in PRIORITIES:
+            if not priority_counts[priority]:
                 continue
 
-            lines.append(f"## {priority_labels[priority]} ({len(priority_tasks)})")
+            lines.append(f"## {PRIORITY_LABELS[priority]} ({priority_counts[priority]})")
             lines.append("")
 
-            # Group by source within priority
-            by_source = {}
-            for task in priority_tasks:
-                for source in task.source_systems:
-                    if source not in by_source:
-                        by_source[source] = []
-                    by_source[source].append(task)
-
             # Sort sources
+            by_source = by_priority[priority]
             for source in sorted(by_source.keys()):
                 source_tasks = by_source[source]
                 lines.append(f"### {source.capitalize()} ({len(source_tasks)} tasks)")
                 lines.append("")
 
                 # Sort by attention tax
-                source_tasks.sort(key=lambda t: t.attention_tax)
+                source_tasks.sort(key=_by_attention_tax)
 
                 for task in source_tasks:
                     # Checkbox and title
@@ -1019,20 +1450,17 @@ class TaskManager:
                     meta_parts = [f"Tax: {task.attention_tax:.1f}"]
 
                     if task.due_date:
-                        days_until = (task.due_date - now).days
+                        days_until = _days_until(task.due_date, today)
                         if days_until < 0:
-                            meta_parts.append(f"Due: {task.due_date.strftime('%Y-%m-%d')} (⚠️ OVERDUE by {abs(days_until)} days)")
+                            meta_parts.append(f"Due: {_format_due(task.due_date)} (⚠️ OVERDUE by {abs(days_until)} days)")
                         elif days_until <= 7:
-                            meta_parts.append(f"Due: {task.due_date.strftime('%Y-%m-%d')} (in {days_until} days)")
+                            meta_parts.append(f"Due: {_format_due(task.due_date)} (in {days_until} days)")
                         else:
-                            meta_parts.append(f"Due: {task.due_date.strftime('%Y-%m-%d')}")
+                            meta_parts.append(f"Due: {_format_due(task.due_date)}")
 
                     # Source link (if Obsidian)
                     if 'obsidian' in task.source_systems:
-                        task_db_path = self._obsidian.task_database.relative_to(vault_path)
-                        encoded_path = urllib.parse.quote(str(task_db_path))
-                        uri = f"obsidian://open?vault={urllib.parse.quote(vault_name)}&file={encoded_path}"
-                        meta_parts.append(f"[View]({uri})")
+                        meta_parts.append(f"[View]({task_db_uri})")
 
                     if len(task.source_systems) > 1:
                         other_sources = [s for s in task.source_systems if s != source]
@@ -1065,12 +1493,12 @@ class TaskManager:
         self.logger.info(f"Finding tasks overdue by {stale_threshold_days}+ days...")
 
         # Get all tasks
-        all_tasks = self.aggregate_tasks()
-        deduplicated_tasks = self.deduplicate_tasks(all_tasks)
+        deduplicated_tasks = self.aggregate_tasks(deduplicate=True)
 
         # Find stale tasks
-        stale_tasks = []
-        now = datetime.now()
+        stale = []  # (days overdue, task)
+        today = date.today()
+        log_each = self.logger.isEnabledFor(logging.INFO)
 
         for task in deduplicated_tasks:
             # Only consider tasks with due dates
@@ -1078,19 +1506,22 @@ class TaskManager:
                 continue
 
             # Calculate days overdue
-            days_overdue = (now - task.due_date).days
+            days_overdue = -_days_until(task.due_date, today)
 
             # Flag if overdue by threshold or more
             if days_overdue >= stale_threshold_days:
-                task.attention_tax = self.calculate_attention_tax(task)
                 task.metadata['days_overdue'] = days_overdue
-                stale_tasks.append(task)
-                self.logger.info(
-                    f"Stale task: '{task.title[:40]}' (overdue by {days_overdue} days)"
-                )
+                stale.append((days_overdue, task))
+                if log_each:
+                    self.logger.info(
+                        f"Stale task: '{task.title[:40]}' (overdue by {days_overdue} days)"
+                    )
 
         # Sort by days overdue (oldest first)
-        stale_tasks.sort(key=lambda t: t.metadata['days_overdue'], reverse=True)
+        stale.sort(key=itemgetter(0), reverse=True)
+        stale_tasks = [task for _, task in stale]
+
+        self.apply_attention_tax(stale_tasks)
 
         self.logger.info(f"Found {len(stale_tasks)} stale tasks (overdue by {stale_threshold_days}+ days)")
 
@@ -1100,63 +1531,15 @@ class TaskManager:
 
     def _get_todoist_tasks(self) -> List[Task]:
         """Get tasks from Todoist via cache"""
-        raw_tasks = self._todoist.get_tasks()
-
-        tasks = []
-        for raw in raw_tasks:
-            task = Task(
-                id=raw['id'],
-                title=raw['title'],
-                priority=raw['priority'],
-                energy=raw['energy'],
-                attention=raw['attention'],
-                due_date=raw['due_date'],
-                source_systems=raw['source_systems'],
-                metadata=raw['metadata']
-            )
-            tasks.append(task)
-
-        return tasks
+        return [Task.from_raw(raw) for raw in self._todoist.get_tasks()]
 
     def _get_obsidian_tasks(self) -> List[Task]:
         """Get tasks from Obsidian task database"""
-        raw_tasks = self._obsidian.get_tasks()
-
-        tasks = []
-        for raw in raw_tasks:
-            task = Task(
-                id=raw['id'],
-                title=raw['title'],
-                priority=raw['priority'],
-                energy=raw['energy'],
-                attention=raw['attention'],
-                due_date=raw['due_date'],
-                source_systems=raw['source_systems'],
-                metadata=raw['metadata']
-            )
-            tasks.append(task)
-
-        return tasks
+        return [Task.from_raw(raw) for raw in self._obsidian.get_tasks()]
 
     def _get_daily_note_tasks(self) -> List[Task]:
         """Get tasks from today's daily note action items"""
-        raw_tasks = self._obsidian.get_daily_note_tasks()
-
-        tasks = []
-        for raw in raw_tasks:
-            task = Task(
-                id=raw['id'],
-                title=raw['title'],
-                priority=raw['priority'],
-                energy=raw['energy'],
-                attention=raw['attention'],
-                due_date=raw['due_date'],
-                source_systems=raw['source_systems'],
-                metadata=raw['metadata']
-            )
-            tasks.append(task)
-
-        return tasks
+        return [Task.from_raw(raw) for raw in self._obsidian.get_daily_note_tasks()]
 
 
 # ==================== CLI Interface ====================
@@ -1190,7 +1573,7 @@ def main():
     )
     parser.add_argument(
         '--priority',
-        choices=['P1', 'P2', 'P3', 'P4', 'all'],
+        choices=[*PRIORITIES, 'all'],
         default='all',
         help='Filter tasks by priority (for list command)'
     )
@@ -1219,47 +1602,53 @@ def main():
         critical_tasks = result['critical']
         recommended_tasks = result['recommended']
 
+        # Collect the report and write it once (not one write per line)
+        out = []
+        today = date.today()
+
         # Show critical tasks first (if any)
         if critical_tasks:
-            print(f"\n🚨 CRITICAL TASKS ({len(critical_tasks)}):")
-            print("=" * 60)
+            out.append(f"\n🚨 CRITICAL TASKS ({len(critical_tasks)}):")
+            out.append("=" * 60)
             for i, task in enumerate(critical_tasks, 1):
-                print(f"\n{i}. [{task.priority}] {task.title}")
-                print(f"   ID: {task.id}")
-                print(f"   Attention Tax: {task.attention_tax:.1f}")
-                print(f"   Energy: {task.energy}, Attention: {task.attention}")
+                out.append(f"\n{i}. [{task.priority}] {task.title}")
+                out.append(f"   ID: {task.id}")
+                out.append(f"   Attention Tax: {task.attention_tax:.1f}")
+                out.append(f"   Energy: {task.energy}, Attention: {task.attention}")
                 if task.due_date:
-                    days_until = (task.due_date - datetime.now()).days
+                    days_until = _days_until(task.due_date, today)
                     if days_until < 0:
-                        print(f"   Due: {task.due_date.strftime('%Y-%m-%d')} (⚠️  OVERDUE by {abs(days_until)} days)")
+                        out.append(f"   Due: {_format_due(task.due_date)} (⚠️  OVERDUE by {abs(days_until)} days)")
                     elif days_until == 0:
-                        print(f"   Due: {task.due_date.strftime('%Y-%m-%d')} (⚠️  DUE TODAY)")
+                        out.append(f"   Due: {_format_due(task.due_date)} (⚠️  DUE TODAY)")
                     elif days_until == 1:
-                        print(f"   Due: {task.due_date.strftime('%Y-%m-%d')} (DUE TOMORROW)")
+                        out.append(f"   Due: {_format_due(task.due_date)} (DUE TOMORROW)")
                     else:
-                        print(f"   Due: {task.due_date.strftime('%Y-%m-%d')} (in {days_until} days)")
-                print(f"   Sources: {', '.join(task.source_systems)}")
+                        out.append(f"   Due: {_format_due(task.due_date)} (in {days_until} days)")
+                out.append(f"   Sources: {', '.join(task.source_systems)}")
         else:
-            print(f"\n✅ No critical tasks - great!")
+            out.append(f"\n✅ No critical tasks - great!")
 
         # Show capacity-matched recommendations
-        print(f"\n\n📋 RECOMMENDED TASKS ({len(recommended_tasks)}):")
-        print("=" * 60)
-        print("(Sorted by Attention Tax: lowest first = easiest wins)\n")
+        out.append(f"\n\n📋 RECOMMENDED TASKS ({len(recommended_tasks)}):")
+        out.append("=" * 60)
+        out.append("(Sorted by Attention Tax: lowest first = easiest wins)\n")
         for i, task in enumerate(recommended_tasks, 1):
-            print(f"{i}. [{task.priority}] {task.title}")
-            print(f"   ID: {task.id}")
-            print(f"   Attention Tax: {task.attention_tax:.1f}")
-            print(f"   Energy: {task.energy}, Attention: {task.attention}")
+            out.append(f"{i}. [{task.priority}] {task.title}")
+            out.append(f"   ID: {task.id}")
+            out.append(f"   Attention Tax: {task.attention_tax:.1f}")
+            out.append(f"   Energy: {task.energy}, Attention: {task.attention}")
             if task.due_date:
-                print(f"   Due: {task.due_date.strftime('%Y-%m-%d')}")
-            print(f"   Sources: {', '.join(task.source_systems)}")
-            print()
+                out.append(f"   Due: {_format_due(task.due_date)}")
+            out.append(f"   Sources: {', '.join(task.source_systems)}")
+            out.append("")
+
+        print('\n'.join(out))
 
     elif args.command == 'list':
         # Get all tasks
         all_tasks = agent.aggregate_tasks()
-        deduplicated_tasks = agent.deduplicate_tasks(all_tasks)
+        deduplicated_tasks = agent.aggregate_tasks(deduplicate=True)
 
         # Apply filters
         filtered_tasks = deduplicated_tasks
@@ -1273,16 +1662,13 @@ def main():
             filtered_tasks = [t for t in filtered_tasks if t.priority == args.priority]
 
         # Calculate attention tax for sorting
-        for task in filtered_tasks:
-            task.attention_tax = agent.calculate_attention_tax(task)
+        agent.apply_attention_tax(filtered_tasks)
 
         # Group tasks by source system
         by_source = {}
         for task in filtered_tasks:
             for source in task.source_systems:
-                if source not in by_source:
-                    by_source[source] = []
-                by_source[source].append(task)
+                by_source.setdefault(source, []).append(task)
 
         # Display results
         filter_desc = []
@@ -1293,108 +1679,109 @@ def main():
 
         filter_str = f" ({', '.join(filter_desc)})" if filter_desc else ""
 
-        print(f"\n📋 ALL TASKS{filter_str}:")
-        print("=" * 60)
-        print(f"Total: {len(filtered_tasks)} tasks (after deduplication)")
-        print(f"Before deduplication: {len(all_tasks)} tasks\n")
+        # Collect the report and write it once (not one write per line)
+        out = []
+        out.append(f"\n📋 ALL TASKS{filter_str}:")
+        out.append("=" * 60)
+        out.append(f"Total: {len(filtered_tasks)} tasks (after deduplication)")
+        out.append(f"Before deduplication: {len(all_tasks)} tasks\n")
 
-        # Show by source
+        # Show by source, sorted by priority then attention tax
+        today = date.today()
         for source in sorted(by_source.keys()):
             source_tasks = by_source[source]
-            print(f"\n{source.upper()} ({len(source_tasks)} tasks):")
-            print("-" * 40)
+            out.append(f"\n{source.upper()} ({len(source_tasks)} tasks):")
+            out.append("-" * 40)
 
-            # Sort by priority then attention tax
-            priority_order = {'P1': 0, 'P2': 1, 'P3': 2, 'P4': 3}
-            source_tasks.sort(key=lambda t: (priority_order.get(t.priority, 4), t.attention_tax))
+            source_tasks.sort(key=lambda t: (PRIORITY_RANK.get(t.priority, len(PRIORITIES)), t.attention_tax))
 
             for task in source_tasks:
-                print(f"\n  [{task.priority}] {task.title}")
-                print(f"  ID: {task.id}")
-                print(f"  Attention Tax: {task.attention_tax:.1f} | Energy: {task.energy} | Attention: {task.attention}")
+                out.append(f"\n  [{task.priority}] {task.title}")
+                out.append(f"  ID: {task.id}")
+                out.append(f"  Attention Tax: {task.attention_tax:.1f} | Energy: {task.energy} | Attention: {task.attention}")
                 if task.due_date:
-                    days_until = (task.due_date - datetime.now()).days
+                    days_until = _days_until(task.due_date, today)
                     if days_until < 0:
-                        print(f"  Due: {task.due_date.strftime('%Y-%m-%d')} (⚠️  OVERDUE by {abs(days_until)} days)")
+                        out.append(f"  Due: {_format_due(task.due_date)} (⚠️  OVERDUE by {abs(days_until)} days)")
                     else:
-                        print(f"  Due: {task.due_date.strftime('%Y-%m-%d')} (in {days_until} days)")
+                        out.append(f"  Due: {_format_due(task.due_date)} (in {days_until} days)")
                 if len(task.source_systems) > 1:
-                    print(f"  Also in: {', '.join([s for s in task.source_systems if s != source])}")
+                    out.append(f"  Also in: {', '.join([s for s in task.source_systems if s != source])}")
+
+        print('\n'.join(out))
 
     elif args.command == 'status':
         # Get all tasks
         all_tasks = agent.aggregate_tasks()
-        deduplicated_tasks = agent.deduplicate_tasks(all_tasks)
+        deduplicated_tasks = agent.aggregate_tasks(deduplicate=True)
 
         # Calculate stats
-        for task in deduplicated_tasks:
-            task.attention_tax = agent.calculate_attention_tax(task)
+        agent.apply_attention_tax(deduplicated_tasks)
 
         # Get current capacity
         capacity = agent.get_current_capacity()
 
-        # Count by source
-        by_source = {}
+        # Count by source and priority, and collect overdue tasks, in one pass
+        by_source = Counter()
+        by_priority = Counter()
+        overdue_tasks = []
+        today = date.today()
         for task in deduplicated_tasks:
-            for source in task.source_systems:
-                by_source[source] = by_source.get(source, 0) + 1
-
-        # Count by priority
-        by_priority = {}
-        for task in deduplicated_tasks:
-            by_priority[task.priority] = by_priority.get(task.priority, 0) + 1
+            by_source.update(task.source_systems)
+            by_priority[task.priority] += 1
+            if task.due_date and _days_until(task.due_date, today) < 0:
+                overdue_tasks.append(task)
 
         # Count critical tasks
         critical_tasks = agent._identify_critical_tasks(deduplicated_tasks)
 
-        # Count overdue tasks
-        now = datetime.now()
-        overdue_tasks = [t for t in deduplicated_tasks if t.due_date and t.due_date < now]
-
-        # Display status
-        print(f"\n📊 TASK MANAGER STATUS:")
-        print("=" * 60)
+        # Display status, collected and written once
+        out = []
+        out.append(f"\n📊 TASK MANAGER STATUS:")
+        out.append("=" * 60)
 
-        print(f"\n🗂️  TASK INVENTORY:")
-        print(f"   Total Tasks (before deduplication): {len(all_tasks)}")
-        print(f"   Total Tasks (after deduplication):  {len(deduplicated_tasks)}")
-        print(f"   Duplicates Merged: {len(all_tasks) - len(deduplicated_tasks)}")
+        out.append(f"\n🗂️  TASK INVENTORY:")
+        out.append(f"   Total Tasks (before deduplication): {len(all_tasks)}")
+        out.append(f"   Total Tasks (after deduplication):  {len(deduplicated_tasks)}")
+        out.append(f"   Duplicates Merged: {len(all_tasks) - len(deduplicated_tasks)}")
 
-        print(f"\n📦 BY SOURCE:")
+        out.append(f"\n📦 BY SOURCE:")
         for source in sorted(by_source.keys()):
-            print(f"   {source.capitalize():<15} {by_source[source]:>3} tasks")
+            out.append(f"   {source.capitalize():<15} {by_source[source]:>3} tasks")
 
-        print(f"\n🎯 BY PRIORITY:")
-        for priority in ['P1', 'P2', 'P3', 'P4']:
+        out.append(f"\n🎯 BY PRIORITY:")
+        for priority in PRIORITIES:
             count = by_priority.get(priority, 0)
             if count > 0:
-                print(f"   {priority:<15} {count:>3} tasks")
+                out.append(f"   {priority:<15} {count:>3} tasks")
 
-        print(f"\n⚡ CURRENT CAPACITY:")
-        print(f"   Energy:    {capacity.energy.capitalize()}")
-        print(f"   Attention: {capacity.attention.capitalize()}")
-        print(f"   (Read from today's daily note at {capacity.timestamp.strftime('%H:%M')})")
+        out.append(f"\n⚡ CURRENT CAPACITY:")
+        out.append(f"   Energy:    {capacity.energy.capitalize()}")
+        out.append(f"   Attention: {capacity.attention.capitalize()}")
+        out.append(f"   (Read from today's daily note at {capacity.timestamp.strftime('%H:%M')})")
 
-        print(f"\n🚨 CRITICAL ALERTS:")
-        print(f"   Critical Tasks:  {len(critical_tasks)}")
-        print(f"   Overdue Tasks:   {len(overdue_tasks)}")
+        out.append(f"\n🚨 CRITICAL ALERTS:")
+        out.append(f"   Critical Tasks:  {len(critical_tasks)}")
+        out.append(f"   Overdue Tasks:   {len(overdue_tasks)}")
 
         if overdue_tasks:
-            print(f"\n   Overdue items:")
-            for task in sorted(overdue_tasks, key=lambda t: t.due_date)[:5]:
-                days_overdue = (now - task.due_date).days
-                print(f"     • [{task.priority}] {task.title[:50]}")
-                print(f"       (overdue by {days_overdue} days)")
+            out.append(f"\n   Overdue items:")
+            for task in heapq.nsmallest(5, overdue_tasks, key=lambda t: _due_sort_key(t.due_date)):
+                days_overdue = -_days_until(task.due_date, today)
+                out.append(f"     • [{task.priority}] {task.title[:50]}")
+                out.append(f"       (overdue by {days_overdue} days)")
 
         # Integration status
-        print(f"\n🔌 INTEGRATIONS:")
-        print(f"   Obsidian:  ✅ Connected")
+        out.append(f"\n🔌 INTEGRATIONS:")
+        out.append(f"   Obsidian:  ✅ Connected")
         if agent._todoist:
-            print(f"   Todoist:   ✅ Connected")
+            out.append(f"   Todoist:   ✅ Connected")
         else:
-            print(f"   Todoist:   ⚪ Disabled")
+            out.append(f"   Todoist:   ⚪ Disabled")
+
+        out.append("")
 
-        print()
+        print('\n'.join(out))
 
     elif args.command == 'complete':
         if not args.task_id:
@@ -1411,27 +1798,32 @@ def main():
 
         threshold = args.stale_threshold or agent.config.get('cleanup', {}).get('stale_threshold_days', 30)
 
-        print(f"\n🧹 STALE TASKS (overdue by {threshold}+ days):")
-        print("=" * 60)
-        print(f"Found {len(stale_tasks)} stale tasks that may need review\n")
+        # Collect the report and write it once (not one write per line)
+        out = []
+
+        out.append(f"\n🧹 STALE TASKS (overdue by {threshold}+ days):")
+        out.append("=" * 60)
+        out.append(f"Found {len(stale_tasks)} stale tasks that may need review\n")
 
         if not stale_tasks:
-            print("✅ No stale tasks found - everything is current!\n")
+            out.append("✅ No stale tasks found - everything is current!\n")
         else:
-            print("These tasks are significantly overdue and may need attention:")
-            print("- Archive/delete if no longer relevant")
-            print("- Update due date if still important")
-            print("- Complete if finished but not marked\n")
+            out.append("These tasks are significantly overdue and may need attention:")
+            out.append("- Archive/delete if no longer relevant")
+            out.append("- Update due date if still important")
+            out.append("- Complete if finished but not marked\n")
 
             for i, task in enumerate(stale_tasks, 1):
                 days_overdue = task.metadata['days_overdue']
-                print(f"{i}. [{task.priority}] {task.title}")
-                print(f"   ID: {task.id}")
-                print(f"   Due Date: {task.due_date.strftime('%Y-%m-%d')}")
-                print(f"   Days Overdue: {days_overdue} days (⚠️  {days_overdue // 30} months)")
-                print(f"   Attention Tax: {task.attention_tax:.1f}")
-                print(f"   Sources: {', '.join(task.source_systems)}")
-                print()
+                out.append(f"{i}. [{task.priority}] {task.title}")
+                out.append(f"   ID: {task.id}")
+                out.append(f"   Due Date: {_format_due(task.due_date)}")
+                out.append(f"   Days Overdue: {days_overdue} days (⚠️  {days_overdue // 30} months)")
+                out.append(f"   Attention Tax: {task.attention_tax:.1f}")
+                out.append(f"   Sources: {', '.join(task.source_systems)}")
+                out.append("")
+
+        print('\n'.join(out))
 
     elif args.command == 'sync-daily':
         success = agent.sync_daily_note()